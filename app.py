@@ -1,11 +1,196 @@
-from flask import Flask, render_template, request, jsonify
-from main import WordleSolver
+from flask import Flask, Response, g, render_template, request, jsonify, make_response, stream_with_context
+from functools import wraps
+from guess_cache import GuessCache, warm
+from jobs import JobManager, JobQueueFull, SharedJobManager
+from main import SOLVER_MODES, WordleSolver
+from multi_board import MULTI_BOARD_VARIANTS, MultiBoardGame
+from sessions import SessionConflict, SessionStore, SQLiteSessionStore
+from speculation import Speculator
+from word_data import WordData
+import hashlib
+import json
+import metrics
 import os
+import threading
+import time
 
 app = Flask(__name__)
 
-# Global solver instance
-solver = WordleSolver()
+SESSION_COOKIE = 'wordle_session'
+MULTI_SESSION_COOKIE = 'wordle_multi_session'
+
+# Minimum seconds between progress events on the optimal-guess stream
+SSE_PROGRESS_INTERVAL = 0.05
+
+# Word lists and pattern tables are loaded once and shared read-only by every game
+word_data = WordData.load()
+
+# Optionally shard optimal-guess searches across a process pool
+if int(os.environ.get('WORDLE_WORKERS', 0)) > 0:
+    word_data.enable_parallel(int(os.environ['WORDLE_WORKERS']))
+
+# Optionally size the optimal-guess cache, persist it to SQLite and pre-warm the opening branches
+word_data.guess_cache = GuessCache(max_entries=int(os.environ.get('WORDLE_GUESS_CACHE_SIZE', 100000)),
+                                   path=os.environ.get('WORDLE_GUESS_CACHE') or None)
+if os.environ.get('WORDLE_WARM_CACHE'):
+    threading.Thread(target=warm, args=(word_data,), daemon=True).start()
+
+# Optionally precompute each game's next suggestions in the background after every guess
+speculator = None
+if os.environ.get('WORDLE_SPECULATE'):
+    speculator = Speculator(word_data, budget_seconds=float(os.environ.get('WORDLE_SPECULATE_BUDGET_MS', 2000)) / 1000)
+
+# Background pool for long searches, so they never tie up request threads. With WORDLE_SESSION_DB
+# the jobs' status and results are shared through it too, so any server process can answer a poll
+if os.environ.get('WORDLE_SESSION_DB'):
+    jobs = SharedJobManager(os.environ['WORDLE_SESSION_DB'], workers=int(os.environ.get('WORDLE_JOB_WORKERS', 2)),
+                            max_pending=int(os.environ.get('WORDLE_JOB_QUEUE', 64)))
+else:
+    jobs = JobManager(workers=int(os.environ.get('WORDLE_JOB_WORKERS', 2)),
+                      max_pending=int(os.environ.get('WORDLE_JOB_QUEUE', 64)))
+
+def game_store(kind, game_factory):
+    """
+    Per-player games, evicted by LRU once the cap is hit or after sitting idle. They are held
+    in memory, or with WORDLE_SESSION_DB in a SQLite file every server process shares (see server.py).
+    """
+    max_sessions = int(os.environ.get('WORDLE_MAX_SESSIONS', 10000))
+    ttl_seconds = float(os.environ.get('WORDLE_SESSION_TTL', 3600))
+    if os.environ.get('WORDLE_SESSION_DB'):
+        def restore_game(record):
+            game = game_factory()
+            game.restore(record)
+            return game
+        return SQLiteSessionStore(os.environ['WORDLE_SESSION_DB'], kind, game_factory, restore_game,
+                                  max_sessions, ttl_seconds)
+    return SessionStore(game_factory, max_sessions, ttl_seconds)
+
+sessions = game_store('single', lambda: WordleSolver(word_data=word_data))
+
+# Multi-board games, kept apart from single-board ones under their own cookie
+multi_sessions = game_store('multi', lambda: MultiBoardGame(word_data))
+
+def guess_cache_hit_ratio(stats):
+    """Hits over lookups, 0 before the first lookup."""
+    lookups = stats['hits'] + stats['misses']
+    return stats['hits'] / lookups if lookups else 0.0
+
+# Values read when /metrics is scraped
+metrics.register_gauge('wordle_active_games', 'Games currently held in memory.', lambda: len(sessions))
+metrics.register_gauge('wordle_active_multi_games', 'Multi-board games currently held in memory.',
+                       lambda: len(multi_sessions))
+metrics.register_gauge('wordle_jobs_pending', 'Background jobs queued or running.', lambda: jobs.stats()['pending'])
+metrics.register_gauge('wordle_guess_cache_hits_total', 'Optimal-guess cache hits.',
+                       lambda: word_data.guess_cache.stats()['hits'], 'counter')
+metrics.register_gauge('wordle_guess_cache_misses_total', 'Optimal-guess cache misses.',
+                       lambda: word_data.guess_cache.stats()['misses'], 'counter')
+metrics.register_gauge('wordle_guess_cache_entries', 'Candidate sets in the optimal-guess cache.',
+                       lambda: word_data.guess_cache.stats()['entries'])
+metrics.register_gauge('wordle_guess_cache_hit_ratio', 'Fraction of optimal-guess lookups served from the cache.',
+                       lambda: guess_cache_hit_ratio(word_data.guess_cache.stats()))
+
+# Per-route timing and Server-Timing headers, plus sampled profiles, only when switched on
+if metrics.ENABLED or metrics.PROFILE_SAMPLE:
+    @app.before_request
+    def start_request_timer():
+        metrics.start_request()
+
+    @app.after_request
+    def record_request_timing(response):
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        response.headers['Server-Timing'] = metrics.finish_request(route, response.status_code)
+        return response
+
+
+def session_view(store, cookie):
+    """Decorator passing the caller's game from `store` to the view, holding that game's lock for the request."""
+    def decorate(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            session_id = request.headers.get('X-Session-Id') or request.cookies.get(cookie)
+            session, created = store.get_or_create(session_id)
+            g.game_session = session
+            g.session_created = created
+            with session.lock:
+                response = make_response(view(session.game, *args, **kwargs))
+                try:
+                    store.save(session)
+                except SessionConflict:
+                    response = make_response(jsonify({
+                        'success': False, 'valid': False,
+                        'message': 'The game was changed by another request. Reload it and try again.'}), 409)
+            if created:
+                response.set_cookie(cookie, session.session_id, httponly=True, samesite='Lax')
+            response.headers['X-Session-Id'] = session.session_id
+            return response
+        return wrapper
+    return decorate
+
+with_game = session_view(sessions, SESSION_COOKIE)
+with_multi_game = session_view(multi_sessions, MULTI_SESSION_COOKIE)
+
+
+def requested_mode():
+    """The solver mode asked for with ?mode= (default 'greedy'), or None if it is unknown."""
+    mode = request.args.get('mode', 'greedy')
+    return mode if mode in SOLVER_MODES else None
+
+def wants_compact():
+    """Whether the client asked with ?compact=1 for feedback as pattern codes only."""
+    return request.args.get('compact', '') not in ('', '0', 'false')
+
+def guess_response(result):
+    """JSON for a make_guess() result; compact responses leave out the result names."""
+    if wants_compact():
+        result = {key: value for key, value in result.items() if key != 'results'}
+        if 'boards' in result:
+            result['boards'] = [{key: value for key, value in board.items() if key != 'results'}
+                                for board in result['boards']]
+    return jsonify(result)
+
+def history_entry(state, compact):
+    """JSON for one GameState; compact entries carry the feedback as a pattern code only."""
+    entry = {
+        'guess_number': state.guess_number,
+        'word_guessed': state.word_guessed,
+        'pattern': state.pattern,
+        'possible_words_before': state.possible_count_before,
+        'possible_words_after': state.possible_count_after
+    }
+    if not compact:
+        entry['letter_results'] = state.letter_results
+    return entry
+
+def word_page(words):
+    """Slice a sorted word list by ?page= and ?page_size=; without a page size, return every word."""
+    page_size = request.args.get('page_size', type=int)
+    if not page_size or page_size <= 0:
+        return {'words': words, 'count': len(words)}
+    page = max(request.args.get('page', 0, type=int), 0)
+    return {'words': words[page * page_size:(page + 1) * page_size], 'count': len(words),
+            'page': page, 'page_size': page_size}
+
+def unknown_mode():
+    """Error response for an unsupported ?mode=."""
+    return jsonify({'success': False, 'valid': False,
+                    'message': f"Unknown mode. Choose one of: {', '.join(SOLVER_MODES)}"}), 400
+
+def json_object():
+    """The request's JSON body if it is an object, {} if there is none, or None for any other JSON value."""
+    data = request.get_json(silent=True)
+    if data is None:
+        return {}
+    return data if isinstance(data, dict) else None
+
+def bad_body(message='Expected a JSON object'):
+    """Error response for a request body of the wrong shape."""
+    return jsonify({'success': False, 'valid': False, 'message': message}), 400
+
+
+@app.route('/metrics')
+def get_metrics():
+    """Prometheus scrape endpoint."""
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
 
 @app.route('/')
 def index():
@@ -13,18 +198,22 @@ def index():
     return render_template('index.html')
 
 @app.route('/api/game/status')
-def get_game_status():
+@with_game
+def get_game_status(solver):
     """Get current game status."""
     return jsonify(solver.get_game_status())
 
 @app.route('/api/game/new', methods=['POST'])
-def new_game():
+@with_game
+def new_game(solver):
     """Start a new game."""
     data = request.get_json()
     target_word = data.get('target_word', None)
+    if speculator:
+        speculator.cancel(g.game_session.session_id)
     
     if target_word:
-        if len(target_word) == 5 and target_word.upper() in [w.upper() for w in solver.potential_words]:
+        if len(target_word) == 5 and solver.is_potential(target_word):
             solver.reset_game(target_word.upper())
             return jsonify({'success': True, 'message': 'New game started with custom word'})
         else:
@@ -34,7 +223,8 @@ def new_game():
         return jsonify({'success': True, 'message': 'New game started with random word'})
 
 @app.route('/api/game/guess', methods=['POST'])
-def make_guess():
+@with_game
+def make_guess(solver):
     """Make a guess."""
     data = request.get_json()
     word = data.get('word', '').strip().upper()
@@ -44,80 +234,375 @@ def make_guess():
         return jsonify({'valid': False, 'message': 'Please enter exactly 5 letters.'})
     
     result = solver.make_guess(word, is_user_guess=is_user_guess)
-    return jsonify(result)
+    if speculator and result['valid']:
+        speculator.speculate(g.game_session.session_id, solver)
+    return guess_response(result)
 
 @app.route('/api/game/optimal-guess')
-def get_optimal_guess():
+@with_game
+def get_optimal_guess(solver):
     """Get the computer's optimal guess."""
-    if len(solver.current_possible_words) == 0:
+    if solver.current_possible_count == 0:
         return jsonify({'success': False, 'message': 'No possible words remaining!'})
     
-    optimal_guess = solver.get_computer_guess()
-    return jsonify({'success': True, 'guess': optimal_guess})
+    mode = requested_mode()
+    if mode is None:
+        return unknown_mode()
+
+    budget_ms = request.args.get('budget_ms', type=float)
+    if budget_ms is not None:
+        # Only the greedy search can stop early with its best guess so far
+        if mode != 'greedy':
+            return jsonify({'success': False, 'message': 'budget_ms is only supported with mode=greedy'}), 400
+        progress = solver.get_computer_guess_within(budget_ms / 1000)
+        return jsonify({'success': True, 'guess': progress['guess'], 'mode': mode, 'complete': progress['complete'],
+                        'searched': progress['searched']})
+
+    optimal_guess = solver.get_computer_guess(mode)
+    return jsonify({'success': True, 'guess': optimal_guess, 'mode': mode})
+
+@app.route('/api/game/optimal-guess/stream')
+@with_game
+def stream_optimal_guess(solver):
+    """Stream the optimal-guess search as Server-Sent Events, ending with a 'done' event."""
+    if solver.current_possible_count == 0:
+        result = {'success': False, 'message': 'No possible words remaining!'}
+        return Response(f"event: done\ndata: {json.dumps(result)}\n\n", mimetype='text/event-stream')
+
+    mode = requested_mode()
+    if mode is None:
+        return unknown_mode()
+    # Only the greedy search reports its progress
+    if mode != 'greedy':
+        return jsonify({'success': False, 'message': 'Streaming is only supported with mode=greedy'}), 400
+
+    budget_ms = request.args.get('budget_ms', type=float)
+    deadline = time.monotonic() + budget_ms / 1000 if budget_ms is not None else None
+    search = solver.search_computer_guess()
+
+    def events():
+        progress, last_sent = None, 0.0
+        for progress in search:
+            now = time.monotonic()
+            if now - last_sent >= SSE_PROGRESS_INTERVAL:
+                yield f"event: progress\ndata: {json.dumps(progress)}\n\n"
+                last_sent = now
+            if deadline is not None and now >= deadline:
+                break
+        yield f"event: done\ndata: {json.dumps(dict(progress, success=True, mode=mode))}\n\n"
+
+    return Response(events(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
 
 @app.route('/api/game/computer-guess', methods=['POST'])
-def make_computer_guess():
+@with_game
+def make_computer_guess(solver):
     """Make the computer's optimal guess."""
-    if len(solver.current_possible_words) == 0:
+    if solver.current_possible_count == 0:
         return jsonify({'valid': False, 'message': 'No possible words remaining!'})
-    
-    optimal_guess = solver.get_computer_guess()
+
+    mode = requested_mode()
+    if mode is None:
+        return unknown_mode()
+
+    optimal_guess = solver.get_computer_guess(mode)
     result = solver.make_guess(optimal_guess, is_user_guess=False)
-    return jsonify(result)
+    if speculator and result['valid']:
+        speculator.speculate(g.game_session.session_id, solver)
+    return guess_response(result)
 
 @app.route('/api/game/toggle-answer')
-def toggle_answer():
+@with_game
+def toggle_answer(solver):
     """Toggle answer visibility."""
     solver.toggle_answer_visibility()
     status = solver.get_game_status()
     return jsonify({'show_answer': status['show_answer'], 'target_word': status['target_word']})
 
 @app.route('/api/game/undo', methods=['POST'])
-def undo_guess():
+@with_game
+def undo_guess(solver):
     """Undo to a specific guess."""
     data = request.get_json()
     guess_number = data.get('guess_number', 0)
     
     success = solver.undo_to_guess(guess_number)
+    if speculator:
+        speculator.cancel(g.game_session.session_id)
     if success:
         return jsonify({'success': True, 'message': f'Undone to guess {guess_number}'})
     else:
         return jsonify({'success': False, 'message': 'Invalid guess number'})
 
 @app.route('/api/game/history')
-def get_history():
+@with_game
+def get_history(solver):
     """Get game history."""
-    history = solver.get_game_history()
-    return jsonify([{
-        'guess_number': state.guess_number,
-        'word_guessed': state.word_guessed,
-        'letter_results': state.letter_results,
-        'possible_words_before': len(state.possible_words_before),
-        'possible_words_after': len(state.possible_words_after)
-    } for state in history])
+    compact = wants_compact()
+    return jsonify([history_entry(state, compact) for state in solver.get_game_history()])
 
 @app.route('/api/game/possible-words/<int:guess_number>')
-def get_possible_words(guess_number):
-    """Get possible words for a specific guess number."""
-    if guess_number == 0:
-        words = list(solver.get_possible_words())
-    else:
-        words = list(solver.get_possible_words(guess_number))
-    
-    return jsonify({
-        'guess_number': guess_number,
-        'words': sorted(words),
-        'count': len(words)
-    })
+@with_game
+def get_possible_words(solver, guess_number):
+    """Get possible words for a specific guess number (0 = now), optionally one page at a time."""
+    words = solver.sorted_possible_words(guess_number if guess_number else None)
+    return jsonify(dict(word_page(words), guess_number=guess_number))
 
 @app.route('/api/game/current-possible-words')
-def get_current_possible_words():
-    """Get current possible words."""
-    words = list(solver.current_possible_words)
-    return jsonify({
-        'words': sorted(words),
-        'count': len(words)
-    })
+@with_game
+def get_current_possible_words(solver):
+    """Get current possible words, optionally one page at a time."""
+    return jsonify(word_page(solver.sorted_possible_words()))
+
+@app.route('/api/game/snapshot')
+@with_game
+def get_snapshot(solver):
+    """
+    Everything the page shows in one response: the state version, game status, the history
+    entries added since ?since=<version> and, with ?page_size=, a page of the current possible
+    words. Answers 304 Not Modified while the client's ETag is still current.
+    """
+    # A client holding this version already has everything, whatever it passed as ?since=
+    page = f"{request.args.get('page', '')}/{request.args.get('page_size', '')}".encode()
+    etag = f"{g.game_session.session_id}-{solver.state_version}-{hashlib.blake2b(page, digest_size=4).hexdigest()}"
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        since = None if g.session_created else request.args.get('since', type=int)
+        start, states = solver.history_since(since)
+        snapshot = {
+            'version': solver.state_version,
+            'status': solver.get_game_status(),
+            'history_start': start,
+            'history': [history_entry(state, True) for state in states]
+        }
+        if 'page_size' in request.args:
+            snapshot['possible_words'] = word_page(solver.sorted_possible_words())
+        response = jsonify(snapshot)
+
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.route('/api/multi/new', methods=['POST'])
+@with_multi_game
+def new_multi_game(game):
+    """
+    Start a multi-board game: a named "variant" (dordle, quordle, octordle), a number
+    of "boards", or explicit "target_words"; "max_guesses" overrides the guess limit.
+    """
+    data = json_object()
+    if data is None:
+        return bad_body()
+    variant = data.get('variant')
+    if variant is not None and (not isinstance(variant, str) or variant not in MULTI_BOARD_VARIANTS):
+        return bad_body(f"Unknown variant. Choose one of: {', '.join(MULTI_BOARD_VARIANTS)}")
+    if not isinstance(data.get('target_words', []), list):
+        return bad_body('target_words must be a list')
+
+    num_boards, max_guesses = MULTI_BOARD_VARIANTS[variant] if variant else (data.get('boards', 4), None)
+    try:
+        if data.get('max_guesses') is not None:
+            max_guesses = int(data['max_guesses'])
+            if max_guesses < 1:
+                raise ValueError('max_guesses must be at least 1.')
+        game.reset_game(data.get('target_words'), int(num_boards), max_guesses)
+    except (AttributeError, TypeError, ValueError) as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    return jsonify({'success': True, 'message': f'New {len(game.boards)}-board game started'})
+
+@app.route('/api/multi/status')
+@with_multi_game
+def get_multi_status(game):
+    """Get the multi-board game's status, with every board's feedback so far."""
+    return jsonify(game.get_game_status())
+
+@app.route('/api/multi/guess', methods=['POST'])
+@with_multi_game
+def make_multi_guess(game):
+    """Make a guess on every unsolved board."""
+    data = json_object()
+    if data is None or not isinstance(data.get('word', ''), str):
+        return bad_body('Expected a JSON object with a "word" string')
+    word = data.get('word', '').strip().upper()
+    if len(word) != 5:
+        return jsonify({'valid': False, 'message': 'Please enter exactly 5 letters.'})
+    return guess_response(game.make_guess(word))
+
+@app.route('/api/multi/optimal-guess')
+@with_multi_game
+def get_multi_optimal_guess(game):
+    """Get the computer's guess, scored jointly over the unsolved boards."""
+    guess = None if game.game_over else game.get_computer_guess()
+    if guess is None:
+        return jsonify({'success': False, 'message': 'No possible words remaining!'})
+    return jsonify({'success': True, 'guess': guess})
+
+@app.route('/api/multi/computer-guess', methods=['POST'])
+@with_multi_game
+def make_multi_computer_guess(game):
+    """Make the computer's jointly scored guess."""
+    guess = None if game.game_over else game.get_computer_guess()
+    if guess is None:
+        return jsonify({'valid': False, 'message': 'No possible words remaining!'})
+    return guess_response(game.make_guess(guess, is_user_guess=False))
+
+@app.route('/api/multi/toggle-answer')
+@with_multi_game
+def toggle_multi_answer(game):
+    """Toggle answer visibility."""
+    game.toggle_answer_visibility()
+    return jsonify({'show_answer': game.show_answer,
+                    'target_words': [board['target_word'] for board in game.get_game_status()['boards']]})
+
+@app.route('/api/multi/undo', methods=['POST'])
+@with_multi_game
+def undo_multi_guess(game):
+    """Undo every board to a specific guess."""
+    data = json_object()
+    guess_number = data.get('guess_number', 0) if data is not None else None
+    if type(guess_number) is not int:
+        return bad_body('Expected a JSON object with an integer "guess_number"')
+    if game.undo_to_guess(guess_number):
+        return jsonify({'success': True, 'message': f'Undone to guess {guess_number}'})
+    return jsonify({'success': False, 'message': 'Invalid guess number'})
+
+@app.route('/api/multi/possible-words/<int:board>')
+@with_multi_game
+def get_multi_possible_words(game, board):
+    """Get one board's current possible words, optionally one page at a time."""
+    if not 0 <= board < len(game.boards):
+        return jsonify({'success': False, 'message': 'Unknown board'}), 404
+    return jsonify(dict(word_page(game.boards[board].sorted_possible_words()), board=board))
+
+def batch_items(data):
+    """
+    Yield the items of a batch request: the "targets" and "histories" of its parsed JSON
+    body, or, when there is none (data is None), one target word or history per line
+    of its NDJSON body, read lazily.
+    """
+    if data is None:
+        for line in request.stream:
+            if line.strip():
+                yield json.loads(line)
+        return
+
+    yield from data.get('targets', [])
+    yield from data.get('histories', [])
+
+@app.route('/api/batch/solve', methods=['POST'])
+def batch_solve():
+    """
+    Statelessly solve many targets or (guess, feedback) histories, streaming one
+    JSON result per line as each finishes.
+    """
+    mode = requested_mode()
+    if mode is None:
+        return unknown_mode()
+
+    # A JSON body is checked before the response starts, so a bad one still gets a 400
+    data = None
+    if request.mimetype != 'application/x-ndjson':
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict) or not all(isinstance(data.get(key, []), list)
+                                                 for key in ('targets', 'histories')):
+            return jsonify({'success': False,
+                            'message': 'Expected a JSON object whose "targets" and "histories" are lists'}), 400
+
+    def results():
+        try:
+            for result in WordleSolver(word_data=word_data).solve_batch(batch_items(data), mode):
+                yield json.dumps(result) + '\n'
+        except ValueError as e:
+            yield json.dumps({'error': f'Malformed batch: {e}'}) + '\n'
+
+    return Response(stream_with_context(results()), mimetype='application/x-ndjson')
+
+def computer_guess_job(job, session, apply_guess):
+    """Search for the game's optimal guess, then optionally make it if the game has not moved on."""
+    with session.lock:
+        game = session.game
+        position = (len(game.game_history), game.current_candidates)
+        search = game.search_computer_guess()
+
+    progress = None
+    for progress in search:
+        job.check_cancelled()
+
+    if not apply_guess:
+        return {'success': True, 'guess': progress['guess']}
+
+    with session.lock:
+        if (len(game.game_history), game.current_candidates) != position:
+            raise RuntimeError('The game changed while the guess was being computed.')
+        result = game.make_guess(progress['guess'], is_user_guess=False)
+        try:
+            sessions.save(session)
+        except SessionConflict:
+            raise RuntimeError('The game changed while the guess was being computed.')
+        if speculator and result['valid']:
+            speculator.speculate(session.session_id, game)
+        return result
+
+
+def solve_job(job, targets):
+    """Let the computer play a fresh game against each target."""
+    game = WordleSolver(word_data=word_data)
+    results = []
+    for target in targets:
+        job.check_cancelled()
+        results.append(game.solve(target))
+    return results
+
+
+def submit_job(kind, fn, *args):
+    """Queue a job and answer 202 with its id, or 429 when the queue is full."""
+    try:
+        job = jobs.submit(kind, fn, *args)
+    except JobQueueFull:
+        return jsonify({'success': False, 'message': 'Server busy, try again later.'}), 429
+    return jsonify({'success': True, 'job_id': job.job_id, 'status': job.status}), 202
+
+@app.route('/api/jobs/computer-guess', methods=['POST'])
+@with_game
+def submit_computer_guess(solver):
+    """Compute (and by default make) the computer's guess in the background."""
+    if solver.current_possible_count == 0:
+        return jsonify({'success': False, 'message': 'No possible words remaining!'})
+
+    data = json_object()
+    if data is None:
+        return bad_body()
+    return submit_job('computer-guess', computer_guess_job, g.game_session, data.get('apply', True))
+
+@app.route('/api/jobs/solve', methods=['POST'])
+def submit_solve():
+    """Solve a list of target words in the background."""
+    data = json_object()
+    if data is None or not isinstance(data.get('targets', []), list):
+        return bad_body('Expected a JSON object with a "targets" list')
+    targets = [str(target).upper() for target in data.get('targets', [])]
+    invalid = [target for target in targets if target not in word_data.potential_lookup]
+    if not targets or invalid:
+        return jsonify({'success': False, 'message': 'Targets must be a non-empty list of potential words.',
+                        'invalid': invalid}), 400
+
+    return submit_job('solve', solve_job, targets)
+
+@app.route('/api/jobs/<job_id>')
+def get_job(job_id):
+    """Poll a job's status and result."""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'message': 'Unknown job'}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/api/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    """Cancel a queued or running job."""
+    job = jobs.cancel(job_id)
+    if job is None:
+        return jsonify({'success': False, 'message': 'Unknown job'}), 404
+    return jsonify(job.to_dict())
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=8000)
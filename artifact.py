@@ -0,0 +1,154 @@
+import argparse
+import json
+import mmap
+import os
+import struct
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+from patterns import build_pattern_matrix, derived_file, parse_build_args, words_to_array
+
+# Bump whenever the layout or the meaning of any table changes
+ARTIFACT_FORMAT_VERSION = 1
+
+# File layout: magic, version and table-of-contents length, the JSON table of contents,
+# then each array's raw bytes at a 64-byte aligned offset
+MAGIC = b'WORDLEDB'
+HEADER = struct.Struct('<8sII')
+ALIGNMENT = 64
+
+
+def artifact_file(potential_file: str, acceptable_file: str) -> Optional[str]:
+    """Path of the compiled artifact for these word lists, or None if they are not on disk."""
+    return derived_file(potential_file, acceptable_file, f"wordle-v{ARTIFACT_FORMAT_VERSION}", '.bin')
+
+
+def pack_words(words) -> np.ndarray:
+    """Pack 5-letter upper-case words into an (N, 5) array of ASCII bytes."""
+    return np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8).reshape(len(words), 5)
+
+
+def unpack_words(packed: np.ndarray) -> tuple:
+    """Inverse of pack_words()."""
+    raw = packed.tobytes().decode('ascii')
+    return tuple(raw[i:i + 5] for i in range(0, len(raw), 5))
+
+
+def posting_tables(words) -> Dict[str, np.ndarray]:
+    """
+    Packed posting bits of a word list, bit i standing for word i:
+    positions[i, letter] for `letter` at position i, counts[letter, n] for at least n copies of `letter`.
+    """
+    letters = words_to_array(list(words))
+    positions = np.array([[np.packbits(letters[:, i] == letter, bitorder='little') for letter in range(26)]
+                          for i in range(5)], dtype=np.uint8).reshape(5, 26, -1)
+    counts = np.array([[np.packbits((letters == letter).sum(axis=1) >= n, bitorder='little') for n in range(7)]
+                       for letter in range(26)], dtype=np.uint8).reshape(26, 7, -1)
+    return {'positions': positions, 'counts': counts}
+
+
+def letter_presence(words) -> np.ndarray:
+    """Return an (N, 26) boolean array marking which letters each word contains."""
+    letters = words_to_array(list(words))
+    presence = np.zeros((len(words), 26), dtype=bool)
+    presence[np.arange(len(words))[:, None], letters] = True
+    return presence
+
+
+def compile_tables(potential_words, acceptable_words) -> Dict[str, np.ndarray]:
+    """Every table derived from the two word lists."""
+    guess_index = {word: i for i, word in enumerate(acceptable_words)}
+    potential_postings = posting_tables(potential_words)
+    acceptable_postings = posting_tables(acceptable_words)
+    return {
+        'potential_words': pack_words(potential_words),
+        'acceptable_words': pack_words(acceptable_words),
+        'potential_positions': potential_postings['positions'],
+        'potential_counts': potential_postings['counts'],
+        'acceptable_positions': acceptable_postings['positions'],
+        'acceptable_counts': acceptable_postings['counts'],
+        'guess_letters': letter_presence(acceptable_words),
+        'answer_letters': letter_presence(potential_words),
+        'answer_rows': np.array([guess_index.get(word, -1) for word in potential_words], dtype=np.int64),
+        'pattern_matrix': build_pattern_matrix(list(acceptable_words), list(potential_words))
+    }
+
+
+def write_artifact(path: str, tables: Dict[str, np.ndarray]):
+    """Write the tables to one binary file, atomically."""
+    # The table of contents' own size moves the data offsets, so lay them out from a generous header size
+    contents = {}
+    offset = ALIGNMENT * 64
+    for name, array in tables.items():
+        contents[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+    toc = json.dumps(contents).encode('utf-8')
+    if HEADER.size + len(toc) > ALIGNMENT * 64:
+        raise ValueError("Artifact table of contents is too large")
+
+    temp_file = f"{path}.{os.getpid()}.tmp"
+    with open(temp_file, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, ARTIFACT_FORMAT_VERSION, len(toc)) + toc)
+        for name, array in tables.items():
+            f.seek(contents[name]['offset'])
+            f.write(np.ascontiguousarray(array).tobytes())
+        f.truncate(offset)
+    os.replace(temp_file, path)
+
+
+def read_artifact(path: str) -> Optional[Dict[str, np.ndarray]]:
+    """Memory-map an artifact and return read-only views of its tables, or None if it is missing or invalid."""
+    try:
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, toc_length = HEADER.unpack_from(mapped)
+        if magic != MAGIC or version != ARTIFACT_FORMAT_VERSION:
+            return None
+        contents = json.loads(mapped[HEADER.size:HEADER.size + toc_length])
+        return {name: np.ndarray(tuple(entry['shape']), np.dtype(entry['dtype']), buffer=mapped,
+                                 offset=entry['offset'])
+                for name, entry in contents.items()}
+    except (OSError, ValueError, TypeError, KeyError, struct.error):
+        return None
+
+
+def load_artifact(potential_file: str, acceptable_file: str) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Return the compiled tables for these word lists, compiling them first if the
+    artifact is missing or the text files changed. Returns None when there is no
+    artifact to use, so the caller can fall back to parsing the text files.
+    """
+    path = artifact_file(potential_file, acceptable_file)
+    if path is None:
+        return None
+
+    tables = read_artifact(path)
+    if tables is not None:
+        return tables
+
+    from word_data import load_words
+    try:
+        write_artifact(path, compile_tables(load_words(potential_file), load_words(acceptable_file)))
+    except OSError:
+        print(f"Warning: could not write word list artifact {path}.")
+        return None
+    return read_artifact(path)
+
+
+def main():
+    """Compile the word lists into the binary artifact the solver loads at startup."""
+    parser = argparse.ArgumentParser(description="Compile the word lists and derived tables into one artifact.")
+    args, path = parse_build_args(parser, artifact_file)
+    if path is None:
+        return
+
+    from word_data import load_words
+    start = time.perf_counter()
+    write_artifact(path, compile_tables(load_words(args.potential), load_words(args.acceptable)))
+    print(f"📦 Compiled {os.path.getsize(path) / 1e6:.1f} MB in {time.perf_counter() - start:.1f} s -> {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+import argparse
+import json
+import random
+import resource
+import time
+from collections import Counter, defaultdict
+from functools import partial, wraps
+from multiprocessing import Pool
+from typing import Dict, List
+
+from guess_cache import GuessCache
+from lookahead import Lookahead
+from main import SOLVER_MODES, WordleSolver
+
+# Solver methods whose call counts and cumulative time are reported
+TIMED_METHODS = [
+    'evaluate_guess',
+    'evaluate_pattern',
+    'filter_words_by_guess',
+    'filter_candidates',
+    'calculate_guess_score',
+    'calculate_optimal_guess',
+    'calculate_optimal_guess_for_mask',
+]
+
+
+def instrument(solver: WordleSolver, timings: Dict[str, List[float]]):
+    """Wrap the solver's hot-path methods so each call adds to timings[name] = [calls, seconds]."""
+    for name in TIMED_METHODS:
+        method = getattr(solver, name)
+
+        def timed(*args, _method=method, _stats=timings[name], **kwargs):
+            start = time.perf_counter()
+            try:
+                return _method(*args, **kwargs)
+            finally:
+                _stats[0] += 1
+                _stats[1] += time.perf_counter() - start
+
+        setattr(solver, name, wraps(method)(timed))
+
+
+def play_games(targets: List[str], mode: str = 'greedy', use_tree: bool = True, use_cache: bool = True) -> Dict:
+    """
+    Let the computer play one game per target and collect per-game and per-guess measurements.
+    Without the decision tree, or with an empty guess cache (and lookahead memo) for every
+    target, each guess runs the full search instead of a lookup.
+    """
+    solver = WordleSolver()
+    if not use_tree:
+        solver.word_data.decision_tree = None
+    timings = defaultdict(lambda: [0, 0.0])
+    instrument(solver, timings)
+
+    games = []
+    latencies = []
+    for target in targets:
+        if not use_cache:
+            solver.word_data.guess_cache = GuessCache()
+            solver.word_data.lookahead = Lookahead(solver.word_data)
+        solver.reset_game(target)
+        guesses = []
+        result = {'won': False}
+        while solver.current_possible_count > 0:
+            start = time.perf_counter()
+            guess = solver.get_computer_guess(mode)
+            result = solver.make_guess(guess, is_user_guess=False)
+            latencies.append(time.perf_counter() - start)
+            guesses.append(guess)
+            if result['game_over']:
+                break
+        games.append({'target': target, 'guesses': guesses, 'won': result['won']})
+
+    return {
+        'games': games,
+        'latencies': latencies,
+        'timings': dict(timings),
+        'peak_memory_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    }
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(runs: List[Dict], wall_time: float, config: Dict) -> Dict:
+    """Merge the results of every worker into one report."""
+    games = [game for run in runs for game in run['games']]
+    latencies = [latency for run in runs for latency in run['latencies']]
+    timings = defaultdict(lambda: [0, 0.0])
+    for run in runs:
+        for name, (calls, seconds) in run['timings'].items():
+            timings[name][0] += calls
+            timings[name][1] += seconds
+
+    wins = [game for game in games if game['won']]
+    distribution = Counter(str(len(game['guesses'])) for game in wins)
+    distribution['X'] = len(games) - len(wins)
+
+    return {
+        'config': config,
+        'games': len(games),
+        'wins': len(wins),
+        'failure_rate': (len(games) - len(wins)) / len(games) if games else 0.0,
+        'mean_guesses': sum(len(game['guesses']) for game in wins) / len(wins) if wins else None,
+        'guess_distribution': dict(sorted(distribution.items())),
+        'failures': [game['target'] for game in games if not game['won']],
+        'latency_ms': {
+            'mean': 1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+            'p50': 1000 * percentile(latencies, 0.50),
+            'p90': 1000 * percentile(latencies, 0.90),
+            'p99': 1000 * percentile(latencies, 0.99),
+            'max': 1000 * max(latencies, default=0.0)
+        },
+        'function_time': {name: {'calls': calls, 'total_s': seconds}
+                          for name, (calls, seconds) in sorted(timings.items())},
+        'peak_memory_kb': max(run['peak_memory_kb'] for run in runs),
+        'wall_time_s': wall_time
+    }
+
+
+def main():
+    """Play the solver against every answer word (or a sample) and write a JSON report."""
+    parser = argparse.ArgumentParser(description="Benchmark the Wordle solver over the answer list.")
+    parser.add_argument('--sample', type=int, default=None, help="Number of answer words to play (default: all)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for --sample")
+    parser.add_argument('--processes', type=int, default=1, help="Number of worker processes")
+    parser.add_argument('--mode', choices=SOLVER_MODES, default='greedy', help="Solver mode to benchmark")
+    parser.add_argument('--no-tree', action='store_true', help="Search every guess instead of walking the decision tree")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Start every game with an empty optimal-guess cache, so searches are not memoized across games")
+    parser.add_argument('--output', default='benchmark.json', help="Path of the JSON report")
+    args = parser.parse_args()
+
+    targets = list(WordleSolver().potential_words)
+    if args.sample is not None and args.sample < len(targets):
+        targets = random.Random(args.seed).sample(targets, args.sample)
+
+    start = time.perf_counter()
+    if args.processes > 1:
+        chunks = [targets[i::args.processes] for i in range(args.processes)]
+        with Pool(args.processes) as pool:
+            runs = pool.map(partial(play_games, mode=args.mode, use_tree=not args.no_tree,
+                                    use_cache=not args.no_cache), chunks)
+    else:
+        runs = [play_games(targets, args.mode, not args.no_tree, not args.no_cache)]
+    wall_time = time.perf_counter() - start
+
+    report = summarize(runs, wall_time, {'sample': args.sample, 'seed': args.seed, 'processes': args.processes,
+                                         'mode': args.mode, 'decision_tree': not args.no_tree,
+                                         'guess_cache': not args.no_cache})
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"🎯 {report['wins']}/{report['games']} solved, "
+          f"mean {report['mean_guesses'] or 0:.3f} guesses, failure rate {report['failure_rate']:.2%}")
+    print(f"⏱️  p50 {report['latency_ms']['p50']:.1f} ms, p99 {report['latency_ms']['p99']:.1f} ms, "
+          f"wall {wall_time:.1f} s")
+    print(f"📄 Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
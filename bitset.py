@@ -0,0 +1,41 @@
+from typing import Iterable
+
+import numpy as np
+
+# Candidate sets are Python ints used as fixed-width bitsets: bit i is set when
+# word i of the indexed list is still possible. Intersections, counts and
+# hashing all run in O(words / 64) without touching any strings.
+
+
+def full_mask(size: int) -> int:
+    """Return a bitset with the first `size` bits set."""
+    return (1 << size) - 1
+
+
+def mask_from_indices(indices: Iterable[int]) -> int:
+    """Build a bitset from word indices."""
+    mask = 0
+    for i in indices:
+        mask |= 1 << int(i)
+    return mask
+
+
+def mask_from_bools(flags: np.ndarray) -> int:
+    """Build a bitset from a boolean array, bit i taken from flags[i]."""
+    return int.from_bytes(np.packbits(flags, bitorder='little').tobytes(), 'little')
+
+
+def mask_to_bools(mask: int, size: int) -> np.ndarray:
+    """Expand a bitset into a boolean array of length `size`."""
+    raw = np.frombuffer(mask.to_bytes((size + 7) // 8, 'little'), dtype=np.uint8)
+    return np.unpackbits(raw, count=size, bitorder='little').astype(bool)
+
+
+def mask_to_indices(mask: int, size: int) -> np.ndarray:
+    """Return the sorted indices of the set bits as an index array."""
+    return np.flatnonzero(mask_to_bools(mask, size))
+
+
+def lowest_index(mask: int) -> int:
+    """Return the index of the lowest set bit, or -1 for an empty bitset."""
+    return (mask & -mask).bit_length() - 1
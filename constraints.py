@@ -0,0 +1,118 @@
+from typing import Tuple
+
+from patterns import CORRECT, WRONG_POSITION
+from word_index import WordIndex
+
+ALL_LETTERS = (1 << 26) - 1
+
+
+def letter_number(letter: str) -> int:
+    """Map 'A'..'Z' to 0..25."""
+    return ord(letter) - ord('A')
+
+
+class Constraints:
+    """
+    Everything learned about the target from the guesses so far.
+    Instances are immutable: apply() returns a new object, so each GameState
+    keeps its own and undoing a guess just drops the later states.
+    """
+
+    __slots__ = ('allowed', 'min_counts', 'max_counts', 'greens')
+
+    def __init__(self, allowed: Tuple[int, ...] = (ALL_LETTERS,) * 5,
+                 min_counts: Tuple[int, ...] = (0,) * 26,
+                 max_counts: Tuple[int, ...] = (5,) * 26,
+                 greens: Tuple[str, ...] = ('',) * 5):
+        self.allowed = allowed          # Per-position bitmask of letters that may still go there
+        self.min_counts = min_counts    # Per-letter minimum number of occurrences
+        self.max_counts = max_counts    # Per-letter maximum number of occurrences
+        self.greens = greens            # Known letter per position, '' when unknown
+
+    def apply(self, guess: str, pattern: int) -> 'Constraints':
+        """Return the constraints after also learning the feedback (pattern code) of this guess."""
+        allowed = list(self.allowed)
+        min_counts = list(self.min_counts)
+        max_counts = list(self.max_counts)
+        greens = list(self.greens)
+        found = [0] * 26
+        excluded = set()
+
+        for i, letter in enumerate(guess):
+            number = letter_number(letter)
+            result = pattern % 3
+            pattern //= 3
+            if result == CORRECT:
+                allowed[i] = 1 << number
+                greens[i] = letter
+                found[number] += 1
+            else:
+                allowed[i] &= ~(1 << number)
+                if result == WRONG_POSITION:
+                    found[number] += 1
+                else:
+                    excluded.add(number)
+
+        for number in range(26):
+            min_counts[number] = max(min_counts[number], found[number])
+        for number in excluded:
+            max_counts[number] = min(max_counts[number], found[number])
+
+        return Constraints(tuple(allowed), tuple(min_counts), tuple(max_counts), tuple(greens))
+
+    def is_consistent(self, word: str) -> bool:
+        """Check whether a word could still be the target, in constant time."""
+        counts = [0] * 26
+        for i, letter in enumerate(word):
+            number = letter_number(letter)
+            if not self.allowed[i] >> number & 1:
+                return False
+            counts[number] += 1
+
+        for number in range(26):
+            if not self.min_counts[number] <= counts[number] <= self.max_counts[number]:
+                return False
+        return True
+
+    def candidate_mask(self, index: WordIndex) -> int:
+        """Compile the constraints into a bitset of consistent words in the index."""
+        mask = index.all_words
+        for i, allowed in enumerate(self.allowed):
+            if self.greens[i]:
+                mask &= index.position_masks[i][letter_number(self.greens[i])]
+                continue
+            for number in range(26):
+                if not allowed >> number & 1:
+                    mask &= ~index.position_masks[i][number]
+
+        for number in range(26):
+            if self.min_counts[number]:
+                mask &= index.count_masks[number][self.min_counts[number]]
+            if self.max_counts[number] < 5:
+                mask &= ~index.count_masks[number][self.max_counts[number] + 1]
+        return mask
+
+    def resolved_letters(self) -> int:
+        """
+        Bitmask of letters whose feedback is already known wherever they are guessed:
+        letters ruled out entirely, and letters whose every copy is a known green.
+        """
+        green_counts = [0] * 26
+        for letter in self.greens:
+            if letter:
+                green_counts[letter_number(letter)] += 1
+
+        resolved = 0
+        for number in range(26):
+            if self.max_counts[number] == 0 or green_counts[number] == self.max_counts[number]:
+                resolved |= 1 << number
+        return resolved
+
+    def informative_guesses(self, index: WordIndex) -> int:
+        """Bitset of words in the index containing at least one unresolved letter."""
+        resolved = self.resolved_letters()
+        mask = 0
+        for number in range(26):
+            if not resolved >> number & 1:
+                mask |= index.count_masks[number][1]
+        return mask
@@ -0,0 +1,121 @@
+import argparse
+import os
+import time
+from collections import deque
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from bitset import full_mask, mask_from_indices, mask_to_indices
+from patterns import ALL_CORRECT, derived_file, parse_build_args
+from scoring import SOLVER_VERSION
+
+
+def tree_file(potential_file: str, acceptable_file: str) -> Optional[str]:
+    """Path of the decision tree for these word lists, or None if they are not on disk."""
+    return derived_file(potential_file, acceptable_file, f"decision-tree-v{SOLVER_VERSION}", '.npz')
+
+
+class DecisionTree:
+    """
+    The solver's full strategy from the opening position.
+    Node i guesses acceptable word node_guess[i]; its children are stored CSR-style in
+    edge_code / edge_child[edge_start[i]:edge_start[i + 1]], sorted by pattern code.
+    """
+
+    def __init__(self, node_guess: np.ndarray, edge_start: np.ndarray,
+                 edge_code: np.ndarray, edge_child: np.ndarray):
+        self.node_guess = node_guess
+        self.edge_start = edge_start
+        self.edge_code = edge_code
+        self.edge_child = edge_child
+
+    @classmethod
+    def build(cls, word_data) -> 'DecisionTree':
+        """Expand every reachable (guess, feedback) path from the full answer list."""
+        num_answers = len(word_data.potential_words)
+        node_guess = []
+        edges = []  # (parent, code, child)
+        queue = deque([(full_mask(num_answers), 0)])
+        next_node = 1
+
+        while queue:
+            candidates, node = queue.popleft()
+            guess = word_data.optimal_guess(candidates)
+            row = word_data.guess_index.get(guess, -1)
+            node_guess.append(row)
+            if row < 0:
+                continue
+
+            indices = mask_to_indices(candidates, num_answers)
+            codes = np.asarray(word_data.pattern_matrix[row, indices])
+            for code in np.unique(codes):
+                if code == ALL_CORRECT:
+                    continue
+                edges.append((node, int(code), next_node))
+                queue.append((mask_from_indices(indices[codes == code]), next_node))
+                next_node += 1
+
+        # Children were numbered in BFS order, so edges are already grouped by parent and sorted by code
+        edge_start = np.zeros(len(node_guess) + 1, dtype=np.uint32)
+        np.add.at(edge_start, np.array([parent + 1 for parent, _, _ in edges], dtype=np.intp), 1)
+        return cls(np.array(node_guess, dtype=np.int16 if len(word_data.acceptable_words) < 2 ** 15 else np.int32),
+                   np.cumsum(edge_start, dtype=np.uint32),
+                   np.array([code for _, code, _ in edges], dtype=np.uint8),
+                   np.array([child for _, _, child in edges], dtype=np.uint32))
+
+    def save(self, path: str):
+        """Write the tree to an uncompressed .npz file, atomically."""
+        temp_file = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(temp_file, node_guess=self.node_guess, edge_start=self.edge_start,
+                 edge_code=self.edge_code, edge_child=self.edge_child)
+        os.replace(temp_file, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional['DecisionTree']:
+        """Load a saved tree, or return None if there is none."""
+        try:
+            with np.load(path) as data:
+                return cls(data['node_guess'], data['edge_start'], data['edge_code'], data['edge_child'])
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def __len__(self) -> int:
+        return len(self.node_guess)
+
+    def guess_for(self, path: List[Tuple[int, int]]) -> Optional[int]:
+        """
+        Walk the tree along (guess row, pattern code) pairs and return the next guess row.
+        Returns None as soon as the path leaves the tree, e.g. after a user's own guess.
+        """
+        node = 0
+        for row, code in path:
+            if self.node_guess[node] != row:
+                return None
+            start, stop = self.edge_start[node], self.edge_start[node + 1]
+            position = start + int(np.searchsorted(self.edge_code[start:stop], code))
+            if position == stop or self.edge_code[position] != code:
+                return None
+            node = int(self.edge_child[position])
+
+        row = int(self.node_guess[node])
+        return row if row >= 0 else None
+
+
+def main():
+    """Build the decision tree for the word lists and save it next to them."""
+    from word_data import WordData
+
+    parser = argparse.ArgumentParser(description="Precompute the solver's decision tree.")
+    args, path = parse_build_args(parser, tree_file)
+    if path is None:
+        return
+
+    start = time.perf_counter()
+    tree = DecisionTree.build(WordData(args.potential, args.acceptable))
+    tree.save(path)
+    print(f"🌳 Built {len(tree)} nodes in {time.perf_counter() - start:.1f} s -> {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import argparse
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from bitset import full_mask, mask_from_indices, mask_to_indices
+from patterns import derived_file, parse_build_args
+from process_db import ProcessConnection
+from scoring import SOLVER_VERSION
+
+# Popular human openers whose feedback branches are computed by warm()
+COMMON_OPENERS = ["CRANE", "SLATE", "ADIEU", "RAISE", "STARE", "AUDIO", "ROATE", "SOARE", "TRACE", "CRATE"]
+
+
+def cache_file(potential_file: str, acceptable_file: str) -> Optional[str]:
+    """Default path of the persistent cache for these word lists, or None if they are not on disk."""
+    return derived_file(potential_file, acceptable_file, f"guess-cache-v{SOLVER_VERSION}", '.sqlite3')
+
+
+def fingerprint(candidates: int) -> bytes:
+    """Canonical 16-byte fingerprint of a candidate bitset."""
+    return hashlib.blake2b(candidates.to_bytes((candidates.bit_length() + 7) // 8, 'little'),
+                           digest_size=16).digest()
+
+
+class GuessCache:
+    """
+    Bounded LRU cache of optimal guesses keyed by candidate-set fingerprint.
+    With a path, entries are also written through to SQLite and survive restarts.
+    """
+
+    def __init__(self, max_entries: int = 100000, path: str = None):
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[bytes, Tuple[str, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = ProcessConnection(path, "CREATE TABLE IF NOT EXISTS guesses (fingerprint BLOB PRIMARY KEY, "
+                                           "guess TEXT NOT NULL, score REAL NOT NULL)") if path else None
+
+    def get(self, key: bytes) -> Optional[Tuple[str, float]]:
+        """Return the cached (guess, score) for a fingerprint, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+            row = None
+            if self._db:
+                try:
+                    row = self._db.connection().execute(
+                        "SELECT guess, score FROM guesses WHERE fingerprint = ?", (key,)).fetchone()
+                except sqlite3.OperationalError:
+                    # The file is busy with other workers' writes; the guess is simply recomputed
+                    pass
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._remember(key, (row[0], row[1]))
+            return row[0], row[1]
+
+    def put(self, key: bytes, guess: str, score: float):
+        """Store the optimal guess and its score for a fingerprint."""
+        with self._lock:
+            self._remember(key, (guess, score))
+            if self._db:
+                try:
+                    with self._db.connection() as db:
+                        db.execute("INSERT OR REPLACE INTO guesses VALUES (?, ?, ?)", (key, guess, score))
+                except sqlite3.OperationalError:
+                    # Skip the write rather than fail the request; the entry is still cached in memory
+                    pass
+
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and eviction counters plus the current size."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                    'entries': len(self._entries), 'max_entries': self.max_entries}
+
+    def _remember(self, key: bytes, entry: Tuple[str, float]):
+        """Insert into the in-memory LRU, evicting the oldest entries beyond the cap."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+def warm(word_data, openers: List[str] = None) -> int:
+    """
+    Pre-compute the optimal guess for the opening position and for every feedback
+    branch of the solver's own opener and the common human openers.
+    Returns the number of candidate sets computed.
+    """
+    num_answers = len(word_data.potential_words)
+    everything = full_mask(num_answers)
+    indices = mask_to_indices(everything, num_answers)
+
+    openers = [word_data.optimal_guess(everything)] + list(openers or COMMON_OPENERS)
+    computed = 1
+    for opener in dict.fromkeys(openers):
+        if opener not in word_data.guess_index:
+            continue
+        codes = np.asarray(word_data.pattern_matrix[word_data.guess_index[opener]])
+        for code in np.unique(codes):
+            word_data.optimal_guess(mask_from_indices(indices[codes == code]))
+            computed += 1
+    return computed
+
+
+def main():
+    """Fill the persistent guess cache with the common opening branches."""
+    from word_data import WordData
+
+    parser = argparse.ArgumentParser(description="Pre-warm the persistent optimal-guess cache.")
+    parser.add_argument('--openers', nargs='*', default=None, help="Opening words to expand")
+    args, path = parse_build_args(parser, cache_file)
+    if path is None:
+        return
+
+    word_data = WordData(args.potential, args.acceptable)
+    word_data.guess_cache = GuessCache(path=path)
+    start = time.perf_counter()
+    computed = warm(word_data, args.openers)
+    print(f"🔥 Warmed {computed} candidate sets in {time.perf_counter() - start:.1f} s -> {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from process_db import ProcessConnection
+
+# Seconds between checks of the database for a cancellation made by another process
+CANCEL_POLL_INTERVAL = 0.5
+
+
+class JobQueueFull(Exception):
+    """Raised when the job queue is at capacity and new work is rejected."""
+
+
+class JobCancelled(Exception):
+    """Raised inside a job function once its job has been cancelled."""
+
+
+class Job:
+    """A unit of background work with pollable status and result."""
+
+    __slots__ = ('job_id', 'kind', 'status', 'result', 'error', 'created', 'started', 'finished',
+                 'cancel_requested', 'future', 'poll_cancelled')
+
+    def __init__(self, kind: str):
+        self.job_id = secrets.token_urlsafe(12)
+        self.kind = kind
+        self.status = 'queued'  # queued -> running -> done | failed | cancelled
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.cancel_requested = threading.Event()
+        self.future: Optional[Future] = None
+        # Optional callable reporting a cancellation requested elsewhere, e.g. by another process
+        self.poll_cancelled: Optional[Callable[[], bool]] = None
+
+    def is_cancel_requested(self) -> bool:
+        """Whether cancellation has been requested, here or (with poll_cancelled) elsewhere."""
+        if not self.cancel_requested.is_set() and self.poll_cancelled is not None and self.poll_cancelled():
+            self.cancel_requested.set()
+        return self.cancel_requested.is_set()
+
+    def check_cancelled(self):
+        """Called by job functions between steps; aborts the job once cancellation is requested."""
+        if self.is_cancel_requested():
+            raise JobCancelled()
+
+    def to_dict(self) -> Dict:
+        """JSON-friendly view of the job."""
+        return {
+            'job_id': self.job_id,
+            'kind': self.kind,
+            'status': self.status,
+            'result': self.result,
+            'error': self.error,
+            'created': self.created,
+            'started': self.started,
+            'finished': self.finished
+        }
+
+
+class JobManager:
+    """
+    In-process work queue backed by a thread pool.
+    At most `max_pending` jobs may be queued or running; beyond that submit() raises
+    JobQueueFull so the caller can shed load. Finished jobs are kept for polling,
+    up to `max_retained` of them.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 64, max_retained: int = 1000):
+        self.max_pending = max_pending
+        self.max_retained = max_retained
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='job')
+        self._jobs: 'OrderedDict[str, Job]' = OrderedDict()
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, fn: Callable, *args) -> Job:
+        """Queue fn(job, *args); its return value becomes the job result."""
+        job = self._new_job(kind)
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise JobQueueFull()
+            self._pending += 1
+            self._jobs[job.job_id] = job
+            self._trim()
+        self._save(job)
+        job.future = self.executor.submit(self._run, job, fn, args)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by id."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Cancel a queued job outright, or ask a running one to stop at its next check."""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        job.cancel_requested.set()
+        if job.future is not None and job.future.cancel():
+            self._finish(job, 'cancelled')
+        return job
+
+    def stats(self) -> Dict[str, int]:
+        """Number of queued/running jobs and of jobs kept for polling."""
+        with self._lock:
+            return {'pending': self._pending, 'max_pending': self.max_pending, 'retained': len(self._jobs)}
+
+    def _new_job(self, kind: str) -> Job:
+        return Job(kind)
+
+    def _run(self, job: Job, fn: Callable, args: tuple):
+        if job.is_cancel_requested():
+            self._finish(job, 'cancelled')
+            return
+        job.status = 'running'
+        job.started = time.time()
+        self._save(job)
+        try:
+            job.result = fn(job, *args)
+            self._finish(job, 'done')
+        except JobCancelled:
+            self._finish(job, 'cancelled')
+        except Exception as e:
+            job.error = str(e)
+            self._finish(job, 'failed')
+
+    def _finish(self, job: Job, status: str):
+        with self._lock:
+            if job.finished is not None:
+                return
+            job.status = status
+            job.finished = time.time()
+            self._pending -= 1
+        self._save(job)
+
+    def _save(self, job: Job):
+        """Record a job's new status; jobs held in memory need nothing."""
+
+    def _trim(self):
+        """Forget the oldest finished jobs beyond the retention cap."""
+        excess = len(self._jobs) - self.max_retained
+        for job_id in list(self._jobs):
+            if excess <= 0:
+                break
+            if self._jobs[job_id].finished is not None:
+                del self._jobs[job_id]
+                excess -= 1
+
+
+class SharedJobManager(JobManager):
+    """
+    JobManager whose job status and results are also written to a SQLite file shared by every
+    server process, so a job queued on one worker can be polled or cancelled on any other.
+    Jobs still run on the worker that queued them; a cancellation made elsewhere is picked up
+    at the job's next check_cancelled().
+    """
+
+    def __init__(self, path: str, workers: int = 2, max_pending: int = 64, max_retained: int = 1000):
+        super().__init__(workers, max_pending, max_retained)
+        self.path = path
+        self._db_lock = threading.Lock()
+        self._db = ProcessConnection(path, "CREATE TABLE IF NOT EXISTS jobs (job_id TEXT PRIMARY KEY, "
+                                           "record TEXT NOT NULL, finished REAL, "
+                                           "cancel_requested INTEGER NOT NULL DEFAULT 0)")
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by id, from this process or the shared database."""
+        job = super().get(job_id)
+        if job is not None:
+            return job
+        with self._db_lock:
+            row = self._db.connection().execute("SELECT record FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        record = json.loads(row[0])
+        job = Job(record['kind'])
+        for key, value in record.items():
+            setattr(job, key, value)
+        return job
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """Flag the job as cancelled in the database, and stop it right away if it belongs to this process."""
+        with self._db_lock, self._db.connection() as db:
+            found = db.execute("UPDATE jobs SET cancel_requested = 1 WHERE job_id = ?", (job_id,)).rowcount
+        if not found:
+            return None
+        return super().cancel(job_id) or self.get(job_id)
+
+    def _new_job(self, kind: str) -> Job:
+        job = Job(kind)
+        job.poll_cancelled = self._cancel_poller(job.job_id)
+        return job
+
+    def _save(self, job: Job):
+        with self._db_lock, self._db.connection() as db:
+            db.execute("INSERT INTO jobs (job_id, record, finished) VALUES (?, ?, ?) ON CONFLICT (job_id) "
+                       "DO UPDATE SET record = excluded.record, finished = excluded.finished",
+                       (job.job_id, json.dumps(job.to_dict()), job.finished))
+            if job.finished is not None:
+                db.execute("DELETE FROM jobs WHERE job_id IN (SELECT job_id FROM jobs WHERE finished IS NOT NULL "
+                           "ORDER BY finished DESC LIMIT -1 OFFSET ?)", (self.max_retained,))
+
+    def _cancel_poller(self, job_id: str) -> Callable[[], bool]:
+        """Callable reading the job's cancellation flag, at most every CANCEL_POLL_INTERVAL seconds."""
+        last_poll = [0.0]
+
+        def poll() -> bool:
+            now = time.monotonic()
+            if now - last_poll[0] < CANCEL_POLL_INTERVAL:
+                return False
+            last_poll[0] = now
+            with self._db_lock:
+                row = self._db.connection().execute("SELECT cancel_requested FROM jobs WHERE job_id = ?",
+                                                    (job_id,)).fetchone()
+            return bool(row and row[0])
+        return poll
@@ -0,0 +1,240 @@
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from benchmark import percentile
+from guess_cache import COMMON_OPENERS
+
+# Connection and read timeout for --url runs, in seconds
+HTTP_TIMEOUT = 60
+
+
+def session_kind(path: str) -> str:
+    """Single and multi-board games are separate sessions, so each kind keeps its own session id."""
+    return 'multi' if path.startswith('/api/multi/') else 'game'
+
+
+class InProcessClient:
+    """Drives the app through Flask's test client, in this process."""
+
+    def __init__(self):
+        from app import app
+        self.client = app.test_client()
+        self.session_ids: Dict[str, str] = {}
+
+    def request(self, method: str, path: str, body: Optional[Dict] = None) -> Tuple[int, Optional[Dict]]:
+        """Send one request, keeping the game session it is given; returns (status, JSON body)."""
+        kind = session_kind(path)
+        headers = {'X-Session-Id': self.session_ids[kind]} if kind in self.session_ids else {}
+        response = self.client.open(path, method=method, json=body, headers=headers)
+        if 'X-Session-Id' in response.headers:
+            self.session_ids[kind] = response.headers['X-Session-Id']
+        return response.status_code, response.get_json(silent=True)
+
+
+class HttpClient:
+    """Drives a running server over one keep-alive HTTP connection."""
+
+    def __init__(self, url: str):
+        parts = urlsplit(url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.prefix = parts.path.rstrip('/')
+        self.connection = None
+        self.session_ids: Dict[str, str] = {}
+
+    def request(self, method: str, path: str, body: Optional[Dict] = None) -> Tuple[int, Optional[Dict]]:
+        """Send one request, keeping the game session it is given; returns (status, JSON body)."""
+        kind = session_kind(path)
+        headers = {'Content-Type': 'application/json'}
+        if kind in self.session_ids:
+            headers['X-Session-Id'] = self.session_ids[kind]
+        payload = json.dumps(body).encode() if body is not None else None
+        if self.connection is None:
+            self.connection = http.client.HTTPConnection(self.host, self.port, timeout=HTTP_TIMEOUT)
+        try:
+            self.connection.request(method, self.prefix + path, payload, headers)
+            response = self.connection.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException):
+            # Start afresh on the next request rather than reuse a broken connection
+            self.connection.close()
+            self.connection = None
+            raise
+        session_id = response.getheader('X-Session-Id')
+        if session_id:
+            self.session_ids[kind] = session_id
+        try:
+            return response.status, json.loads(data)
+        except ValueError:
+            return response.status, None
+
+
+class VirtualUser:
+    """One simulated player, running scenarios back to back and recording every request."""
+
+    def __init__(self, client, rng: random.Random):
+        self.client = client
+        self.rng = rng
+        self.records: List[Tuple[str, int, float]] = []  # (route, status, seconds); status 0 = no response
+        self.scenarios = Counter()
+
+    def call(self, route: str, method: str, path: str, body: Optional[Dict] = None) -> Optional[Dict]:
+        """Time one request, recorded under its route template."""
+        start = time.perf_counter()
+        try:
+            status, data = self.client.request(method, path, body)
+        except (OSError, http.client.HTTPException):
+            status, data = 0, None
+        self.records.append((route, status, time.perf_counter() - start))
+        return data
+
+    def play(self):
+        """New game, then a human opener and optimal-guess suggestions or computer guesses, then the history."""
+        self.call('/api/game/new', 'POST', '/api/game/new', {})
+        result = self.call('/api/game/guess', 'POST', '/api/game/guess', {'word': self.rng.choice(COMMON_OPENERS)})
+        while result and result.get('valid') and not result.get('game_over'):
+            if self.rng.random() < 0.5:
+                suggestion = self.call('/api/game/optimal-guess', 'GET', '/api/game/optimal-guess')
+                if not suggestion or not suggestion.get('success'):
+                    break
+                result = self.call('/api/game/guess', 'POST', '/api/game/guess', {'word': suggestion['guess']})
+            else:
+                result = self.call('/api/game/computer-guess', 'POST', '/api/game/computer-guess')
+        self.call('/api/game/history', 'GET', '/api/game/history')
+
+    def browse(self):
+        """What the page fetches to redraw a game: snapshot, status and a page of possible words."""
+        self.call('/api/game/snapshot', 'GET', '/api/game/snapshot?page_size=200')
+        self.call('/api/game/status', 'GET', '/api/game/status')
+        self.call('/api/game/possible-words/<int:guess_number>', 'GET', '/api/game/possible-words/0?page_size=200')
+
+    def undo(self):
+        """Play two computer guesses, undo the second, and replay it."""
+        self.call('/api/game/new', 'POST', '/api/game/new', {})
+        self.call('/api/game/computer-guess', 'POST', '/api/game/computer-guess')
+        self.call('/api/game/computer-guess', 'POST', '/api/game/computer-guess')
+        self.call('/api/game/undo', 'POST', '/api/game/undo', {'guess_number': 1})
+        self.call('/api/game/computer-guess', 'POST', '/api/game/computer-guess')
+
+    def multi(self):
+        """A Quordle game played by the computer."""
+        self.call('/api/multi/new', 'POST', '/api/multi/new', {'variant': 'quordle'})
+        result = {'valid': True}
+        while result and result.get('valid') and not result.get('game_over'):
+            result = self.call('/api/multi/computer-guess', 'POST', '/api/multi/computer-guess?compact=1')
+        self.call('/api/multi/status', 'GET', '/api/multi/status')
+
+
+# Scenario names accepted by --mix
+SCENARIOS = {'play': VirtualUser.play, 'browse': VirtualUser.browse, 'undo': VirtualUser.undo,
+             'multi': VirtualUser.multi}
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parse "play=3,browse=1" into scenario weights (a bare name weighs 1)."""
+    weights = {}
+    for part in mix.split(','):
+        name, _, weight = part.strip().partition('=')
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario {name!r}. Choose from: {', '.join(SCENARIOS)}")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+def run_user(user: VirtualUser, weights: Dict[str, float], deadline: float, iterations: Optional[int]):
+    """Run weighted random scenarios until the deadline or the iteration count is reached."""
+    names, scenario_weights = list(weights), list(weights.values())
+    done = 0
+    while time.perf_counter() < deadline and (iterations is None or done < iterations):
+        name = user.rng.choices(names, scenario_weights)[0]
+        SCENARIOS[name](user)
+        user.scenarios[name] += 1
+        done += 1
+
+
+def summarize(records: List[Tuple[str, int, float]], wall_time: float, scenarios: Counter, config: Dict) -> Dict:
+    """Throughput, latency percentiles and error rates, overall and per route."""
+    def stats(entries):
+        latencies = [seconds for _, _, seconds in entries]
+        errors = sum(1 for _, status, _ in entries if status == 0 or status >= 400)
+        return {
+            'requests': len(entries),
+            'throughput_rps': len(entries) / wall_time if wall_time else 0.0,
+            'errors': errors,
+            'error_rate': errors / len(entries) if entries else 0.0,
+            'statuses': dict(sorted(Counter(str(status) for _, status, _ in entries).items())),
+            'latency_ms': {
+                'mean': 1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+                'p50': 1000 * percentile(latencies, 0.50),
+                'p95': 1000 * percentile(latencies, 0.95),
+                'p99': 1000 * percentile(latencies, 0.99),
+                'max': 1000 * max(latencies, default=0.0)
+            }
+        }
+
+    by_route = defaultdict(list)
+    for record in records:
+        by_route[record[0]].append(record)
+
+    return dict(stats(records), config=config, wall_time_s=wall_time, scenarios=dict(scenarios),
+                routes={route: stats(entries) for route, entries in sorted(by_route.items())})
+
+
+def main():
+    """Drive the API with concurrent virtual users and write a JSON report."""
+    parser = argparse.ArgumentParser(description="Load-test the Wordle solver API.")
+    parser.add_argument('--url', default=None,
+                        help="Base URL of a running server, e.g. http://127.0.0.1:8000 (default: in-process test client)")
+    parser.add_argument('--concurrency', type=int, default=4, help="Number of concurrent virtual users")
+    parser.add_argument('--duration', type=float, default=30, help="Seconds to run for")
+    parser.add_argument('--iterations', type=int, default=None,
+                        help="Scenarios per user; stops early once every user has run this many")
+    parser.add_argument('--mix', default='play=3,browse=2,undo=1',
+                        help=f"Weighted scenarios, e.g. play=3,browse=1 (scenarios: {', '.join(SCENARIOS)})")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for the scenario choices")
+    parser.add_argument('--output', default='loadtest.json', help="Path of the JSON report")
+    args = parser.parse_args()
+
+    try:
+        weights = parse_mix(args.mix)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+
+    users = [VirtualUser(HttpClient(args.url) if args.url else InProcessClient(), random.Random(args.seed + i))
+             for i in range(args.concurrency)]
+    start = time.perf_counter()
+    threads = [threading.Thread(target=run_user, args=(user, weights, start + args.duration, args.iterations))
+               for user in users]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall_time = time.perf_counter() - start
+
+    records = [record for user in users for record in user.records]
+    scenarios = sum((user.scenarios for user in users), Counter())
+    report = summarize(records, wall_time, scenarios,
+                       {'target': args.url or 'in-process', 'concurrency': args.concurrency,
+                        'duration': args.duration, 'iterations': args.iterations, 'mix': weights,
+                        'seed': args.seed})
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"🚦 {report['requests']} requests in {wall_time:.1f} s ({report['throughput_rps']:.1f} req/s), "
+          f"error rate {report['error_rate']:.2%}")
+    for route, route_stats in report['routes'].items():
+        latency = route_stats['latency_ms']
+        print(f"   {route}: {route_stats['requests']} requests, p50 {latency['p50']:.1f} ms, "
+              f"p95 {latency['p95']:.1f} ms, p99 {latency['p99']:.1f} ms")
+    print(f"📄 Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import math
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from bitset import mask_from_indices
+from guess_cache import fingerprint
+from patterns import ALL_CORRECT
+from scoring import partition_sums
+
+# Guesses planned exactly before the greedy policy's cost is used for what is left
+LOOKAHEAD_DEPTH = 2
+
+# Best one-step guesses expanded at each node of the lookahead
+LOOKAHEAD_BEAM = 8
+
+# Larger candidate sets are left to the greedy search; the lookahead tree grows too fast above this
+LOOKAHEAD_MAX_CANDIDATES = 250
+
+# Memoized subproblems kept before the tables are cleared
+LOOKAHEAD_MEMO_SIZE = 200000
+
+
+def lower_bound(n: int) -> float:
+    """
+    Admissible bound on the expected guesses needed to find one of n equally likely words:
+    at best the next guess is one of them and tells every other apart, leaving one more guess.
+    """
+    return (2 * n - 1) / n
+
+
+class Lookahead:
+    """
+    Multi-step search minimizing the expected total number of guesses rather than the
+    expected remaining words after one guess. The most promising guesses (see beam_rows())
+    are expanded `depth` guesses deep, after which the greedy policy's own expected guesses is used.
+    Guesses whose lower bound cannot beat the best so far are cut off (branch and bound),
+    and subproblems are memoized by candidate set.
+    """
+
+    def __init__(self, word_data, memo_size: int = LOOKAHEAD_MEMO_SIZE):
+        self.word_data = word_data
+        self.memo_size = memo_size
+        self.nodes = 0
+        self._greedy: Dict[bytes, float] = {}
+        self._values: Dict[Tuple[bytes, int, int], Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def best_guess(self, candidates: np.ndarray, guesses: Optional[np.ndarray] = None,
+                   depth: int = LOOKAHEAD_DEPTH, beam: int = LOOKAHEAD_BEAM) -> Tuple[str, float]:
+        """Return the guess with the lowest expected total guesses for the candidates, and that expectation."""
+        return self._value(candidates, depth, beam, guesses)
+
+    def greedy_cost(self, candidates: np.ndarray) -> float:
+        """Expected guesses to finish when every later guess is the greedy optimal guess."""
+        n = len(candidates)
+        if n <= 2:
+            return lower_bound(n)
+
+        mask = mask_from_indices(candidates)
+        key = fingerprint(mask)
+        cost = self._greedy.get(key)
+        if cost is None:
+            row = self.word_data.guess_index[self.word_data.optimal_guess(mask)]
+            cost = 1 + sum(len(part) * self.greedy_cost(part) for part in self.partitions(row, candidates)) / n
+            self._remember(self._greedy, key, cost)
+        return cost
+
+    def partitions(self, row: int, candidates: np.ndarray) -> List[np.ndarray]:
+        """Split the candidates by the feedback guess `row` gets, dropping the all-correct group."""
+        codes = np.asarray(self.word_data.pattern_matrix[row, candidates])
+        order = np.argsort(codes, kind='stable')
+        codes = codes[order]
+        boundaries = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+        return [part for part, code in zip(np.split(candidates[order], boundaries), codes[np.r_[0, boundaries]])
+                if code != ALL_CORRECT]
+
+    def beam_rows(self, ranked: np.ndarray, candidates: np.ndarray, beam: int) -> List[int]:
+        """
+        The guesses worth expanding: the `beam` best by one-step score, plus the `beam` best
+        candidate words, which the one-step score undervalues because they can win outright.
+        """
+        rows = list(ranked[:beam])
+        is_candidate = np.isin(ranked, self.word_data.answer_rows[candidates])
+        rows += [row for row in ranked[is_candidate][:beam] if row not in rows]
+        return [int(row) for row in rows]
+
+    def expected_guesses(self, row: int, candidates: np.ndarray, depth: int, beam: int,
+                         bound: float = math.inf) -> float:
+        """
+        Expected total guesses when guessing `row` now and searching `depth - 1` guesses deeper.
+        Gives up and returns a value >= bound as soon as the guess provably cannot beat `bound`.
+        """
+        n = len(candidates)
+        parts = sorted(self.partitions(row, candidates), key=len, reverse=True)
+        remaining_bound = sum(len(part) * lower_bound(len(part)) for part in parts)
+        total = 0.0
+        for part in parts:
+            if 1 + (total + remaining_bound) / n >= bound:
+                break
+            remaining_bound -= len(part) * lower_bound(len(part))
+            total += len(part) * self._value(part, depth - 1, beam)[1]
+        return 1 + (total + remaining_bound) / n
+
+    def _value(self, candidates: np.ndarray, depth: int, beam: int,
+               guesses: Optional[np.ndarray] = None) -> Tuple[str, float]:
+        """Best (guess, expected total guesses) for a candidate set, memoized."""
+        n = len(candidates)
+        if n <= 2 or depth <= 0:
+            mask = mask_from_indices(candidates)
+            return self.word_data.optimal_guess(mask), self.greedy_cost(candidates)
+
+        # Guess pruning only drops guesses that never make the beam, so it is not part of the key
+        key = (fingerprint(mask_from_indices(candidates)), depth, beam)
+        if key in self._values:
+            return self._values[key]
+
+        self.nodes += 1
+        rows = np.arange(len(self.word_data.acceptable_words)) if guesses is None else guesses
+        sums = partition_sums(self.word_data.pattern_matrix, candidates, guesses)
+        ranked = rows[np.lexsort((rows, sums))]
+        best_row, best_cost = -1, math.inf
+        for row in self.beam_rows(ranked, candidates, beam):
+            cost = self.expected_guesses(row, candidates, depth, beam, best_cost)
+            if cost < best_cost:
+                best_row, best_cost = int(row), cost
+
+        value = (self.word_data.acceptable_words[best_row], best_cost)
+        self._remember(self._values, key, value)
+        return value
+
+    def _remember(self, table: Dict, key, value):
+        """Store a memo entry, starting the table afresh once it is full."""
+        with self._lock:
+            if len(table) >= self.memo_size:
+                table.clear()
+            table[key] = value
@@ -1,13 +1,35 @@
 import random
+import time
 from collections import defaultdict, Counter
-from typing import List, Dict, Set
+from typing import List, Dict, Iterable, Iterator, Optional, Set
+
+import numpy as np
+
+import metrics
+from bitset import full_mask, mask_from_indices, mask_to_indices
+from constraints import Constraints
+from lookahead import LOOKAHEAD_MAX_CANDIDATES
+from patterns import (ALL_CORRECT, CORRECT, INCORRECT, WRONG_POSITION, decode_pattern, encode_pattern,
+                      parse_feedback)
+from word_data import WordData
+
+# How the computer picks guesses: one-step expected remaining words, or multi-step expected total guesses
+SOLVER_MODES = ('greedy', 'lookahead')
 
 
 class WordleSolver:
-    def __init__(self, potential_file: str = "potential.txt", acceptable_file: str = "acceptable.txt"):
+    def __init__(self, potential_file: str = "potential.txt", acceptable_file: str = "acceptable.txt",
+                 word_data: WordData = None):
         """Initialize the Wordle solver with word lists."""
-        self.potential_words = self.load_words(potential_file)
-        self.acceptable_words = self.load_words(acceptable_file)
+        # Word lists and precomputed tables are shared, read-only, across every game
+        self.word_data = word_data or WordData.load(potential_file, acceptable_file)
+        self.potential_words = self.word_data.potential_words
+        self.acceptable_words = self.word_data.acceptable_words
+        self.guess_index = self.word_data.guess_index
+        self.answer_index = self.word_data.answer_index
+        self.pattern_matrix = self.word_data.pattern_matrix
+        self.potential_lookup = self.word_data.potential_lookup
+        self.acceptable_lookup = self.word_data.acceptable_lookup
 
         # Game state
         self.target_word = ""
@@ -17,26 +39,16 @@ class WordleSolver:
 
         # Game history for undo functionality
         self.game_history = []  # List of GameState objects
-        self.current_possible_words = set(self.potential_words)
+        self.current_candidates = full_mask(len(self.potential_words))  # Bitset over potential_words
+
+        # Bumped on every change, so clients can tell whether their copy of the game is current
+        self.state_version = 0
+        # Version at which the history last lost entries (new game or undo)
+        self.history_version = 0
 
         # Initialize first game state
         self.reset_game()
 
-    def load_words(self, filename: str) -> List[str]:
-        """Load words from a file, filtering for 5-letter words."""
-        try:
-            with open(filename, 'r') as f:
-                words = [word.strip().upper() for word in f.readlines()]
-                return [word for word in words if len(word) == 5 and word.isalpha()]
-        except FileNotFoundError:
-            print(f"Warning: {filename} not found. Using sample words.")
-            # Sample words for demonstration
-            if "potential" in filename:
-                return ["CRANE", "SLATE", "ROATE", "RAISE", "ADIEU", "AUDIO", "HOUSE", "MOUSE", "PHONE", "STONE"]
-            else:
-                return ["CRANE", "SLATE", "ROATE", "RAISE", "ADIEU", "AUDIO", "HOUSE", "MOUSE", "PHONE", "STONE",
-                        "ABOUT", "WORLD", "WOULD", "THERE", "THEIR", "COULD", "OTHER", "AFTER", "FIRST", "NEVER"]
-
     def reset_game(self, new_target: str = None):
         """Reset the game state."""
         if new_target:
@@ -45,51 +57,90 @@ class WordleSolver:
             self.target_word = random.choice(self.potential_words)
 
         self.current_guess = 0
-        self.current_possible_words = set(self.potential_words)
+        self.current_candidates = full_mask(len(self.potential_words))
         self.game_history = []
+        self.state_version += 1
+        self.history_version = self.state_version
 
         # Add initial state
         initial_state = GameState(
             guess_number=0,
             word_guessed="",
-            letter_results=[],
-            possible_words_before=set(self.potential_words),
-            possible_words_after=set(self.potential_words)
+            pattern=None,
+            candidates_before=self.current_candidates,
+            candidates_after=self.current_candidates,
+            constraints=Constraints(),
+            version=self.state_version
         )
         self.game_history.append(initial_state)
 
+    @property
+    def current_possible_words(self) -> Set[str]:
+        """Words still possible in the current game."""
+        return self.words_from_mask(self.current_candidates)
+
+    @property
+    def current_constraints(self) -> Constraints:
+        """What the guesses so far have revealed about the target."""
+        return self.game_history[-1].constraints
+
+    @property
+    def current_possible_count(self) -> int:
+        """Number of words still possible in the current game."""
+        return self.game_history[-1].possible_count_after
+
+    def words_from_mask(self, candidates: int) -> Set[str]:
+        """Convert a candidate bitset into the set of potential words it holds."""
+        return {self.potential_words[i] for i in mask_to_indices(candidates, len(self.potential_words))}
+
+    def mask_from_words(self, words) -> int:
+        """Convert potential words into a candidate bitset."""
+        return mask_from_indices(self.answer_index[word] for word in words if word in self.answer_index)
+
+    @metrics.timed('evaluate_guess')
     def evaluate_guess(self, guess: str, target: str) -> List[str]:
         """
         Evaluate a guess against the target word.
         Returns list of results: 'CORRECT', 'WRONG_POSITION', 'INCORRECT'
         """
+        return decode_pattern(self.evaluate_pattern(guess, target))
+
+    @metrics.timed('evaluate_pattern')
+    def evaluate_pattern(self, guess: str, target: str) -> int:
+        """Evaluate a guess against the target word as a base-3 pattern code (see patterns.py)."""
         guess = guess.upper()
         target = target.upper()
-        results = [''] * 5
+        if guess in self.guess_index and target in self.answer_index:
+            return int(self.pattern_matrix[self.guess_index[guess], self.answer_index[target]])
+
+        digits = [INCORRECT] * 5
         target_chars = list(target)
         guess_chars = list(guess)
 
         # First pass: mark correct positions
         for i in range(5):
             if guess_chars[i] == target_chars[i]:
-                results[i] = 'CORRECT'
+                digits[i] = CORRECT
                 target_chars[i] = None  # Mark as used
                 guess_chars[i] = None  # Mark as processed
 
         # Second pass: mark wrong positions
         for i in range(5):
-            if guess_chars[i] is not None:  # Not already processed
-                if guess_chars[i] in target_chars:
-                    results[i] = 'WRONG_POSITION'
-                    # Mark first occurrence as used
-                    target_chars[target_chars.index(guess_chars[i])] = None
-                else:
-                    results[i] = 'INCORRECT'
+            if guess_chars[i] is not None and guess_chars[i] in target_chars:
+                digits[i] = WRONG_POSITION
+                # Mark first occurrence as used
+                target_chars[target_chars.index(guess_chars[i])] = None
 
-        return results
+        return sum(digit * 3 ** i for i, digit in enumerate(digits))
 
+    @metrics.timed('filter_words_by_guess')
     def filter_words_by_guess(self, possible_words: Set[str], guess: str, results: List[str]) -> Set[str]:
         """Filter possible words based on guess results."""
+        guess = guess.upper()
+        if self.is_indexable(guess) and all(word in self.potential_lookup for word in possible_words):
+            return self.words_from_mask(self.filter_candidates(self.mask_from_words(possible_words), guess,
+                                                               encode_pattern(results)))
+
         filtered_words = set()
 
         for word in possible_words:
@@ -98,6 +149,28 @@ class WordleSolver:
 
         return filtered_words
 
+    @metrics.timed('filter_candidates')
+    def filter_candidates(self, candidates: int, guess: str, pattern: int) -> int:
+        """Filter a candidate bitset based on the pattern code a guess got."""
+        guess = guess.upper()
+        if self.is_indexable(guess):
+            return candidates & self.potential_lookup.feedback_mask(guess, pattern)
+
+        return self.mask_from_words(self.filter_words_by_guess(self.words_from_mask(candidates), guess,
+                                                               decode_pattern(pattern)))
+
+    def is_indexable(self, word: str) -> bool:
+        """Whether a word can be looked up in the letter posting index."""
+        return len(word) == 5 and word.isascii() and word.isalpha() and word.isupper()
+
+    def is_acceptable(self, word: str) -> bool:
+        """Whether a word may be guessed."""
+        return word.upper() in self.acceptable_lookup
+
+    def is_potential(self, word: str) -> bool:
+        """Whether a word may be the target."""
+        return word.upper() in self.potential_lookup
+
     def word_matches_pattern(self, word: str, guess: str, results: List[str]) -> bool:
         """Check if a word matches the pattern from a guess."""
         word = word.upper()
@@ -135,8 +208,12 @@ class WordleSolver:
 
         return True
 
+    @metrics.timed('calculate_optimal_guess')
     def calculate_optimal_guess(self, possible_words: Set[str]) -> str:
         """Calculate the optimal guess that minimizes expected remaining words."""
+        if all(word in self.answer_index for word in possible_words):
+            return self.calculate_optimal_guess_for_mask(self.mask_from_words(possible_words))
+
         if len(possible_words) <= 2:
             return list(possible_words)[0]
 
@@ -152,15 +229,29 @@ class WordleSolver:
 
         return best_word
 
+    @metrics.timed('calculate_optimal_guess_for_mask')
+    def calculate_optimal_guess_for_mask(self, candidates: int, constraints: Constraints = None) -> str:
+        """
+        Calculate the optimal guess for a candidate bitset.
+        With constraints, guesses made only of resolved letters are skipped before scoring.
+        """
+        return self.word_data.optimal_guess(candidates, constraints)
+
+    @metrics.timed('calculate_guess_score')
     def calculate_guess_score(self, guess: str, possible_words: Set[str]) -> float:
         """Calculate the expected number of remaining words after this guess."""
+        guess = guess.upper()
+        if guess in self.guess_index and all(word in self.answer_index for word in possible_words):
+            codes = self.pattern_matrix[self.guess_index[guess], self.answer_indices(possible_words)]
+            counts = np.bincount(codes)
+            # Filtering by an exact pattern keeps exactly the words that produced it
+            return float((counts.astype(np.int64) ** 2).sum()) / len(possible_words)
+
         pattern_counts = defaultdict(int)
 
         # For each possible target word, see what pattern this guess would produce
         for target in possible_words:
-            results = self.evaluate_guess(guess, target)
-            pattern = tuple(results)  # Convert to tuple for hashing
-            pattern_counts[pattern] += 1
+            pattern_counts[self.evaluate_pattern(guess, target)] += 1
 
         # Calculate expected remaining words
         total_words = len(possible_words)
@@ -168,17 +259,21 @@ class WordleSolver:
 
         for pattern, count in pattern_counts.items():
             probability = count / total_words
-            remaining_after_pattern = len(self.filter_words_by_guess(possible_words, guess, list(pattern)))
+            remaining_after_pattern = len(self.filter_words_by_guess(possible_words, guess, decode_pattern(pattern)))
             expected_remaining += probability * remaining_after_pattern
 
         return expected_remaining
 
+    def answer_indices(self, words) -> np.ndarray:
+        """Map potential words to their column indices in the pattern matrix."""
+        return np.fromiter((self.answer_index[word] for word in words), dtype=np.intp, count=len(words))
+
     def make_guess(self, word: str, is_user_guess: bool = True) -> Dict:
         """Make a guess and return the results."""
         word = word.upper()
 
         # Validate guess
-        if is_user_guess and word not in [w.upper() for w in self.acceptable_words]:
+        if is_user_guess and not self.is_acceptable(word):
             return {
                 'valid': False,
                 'message': f"'{word}' is not in the acceptable words list."
@@ -191,23 +286,8 @@ class WordleSolver:
             }
 
         # Evaluate the guess
-        results = self.evaluate_guess(word, self.target_word)
-
-        # Filter possible words
-        new_possible_words = self.filter_words_by_guess(self.current_possible_words, word, results)
-
-        # Create game state
-        self.current_guess += 1
-        game_state = GameState(
-            guess_number=self.current_guess,
-            word_guessed=word,
-            letter_results=results,
-            possible_words_before=set(self.current_possible_words),
-            possible_words_after=set(new_possible_words)
-        )
-
-        self.game_history.append(game_state)
-        self.current_possible_words = new_possible_words
+        pattern = self.evaluate_pattern(word, self.target_word)
+        game_state = self.record_guess(word, pattern)
 
         # Check win condition
         is_correct = word == self.target_word
@@ -217,16 +297,50 @@ class WordleSolver:
             'valid': True,
             'guess_number': self.current_guess,
             'word': word,
-            'results': results,
-            'possible_words_before': len(game_state.possible_words_before),
-            'possible_words_after': len(game_state.possible_words_after),
+            'pattern': pattern,
+            'results': decode_pattern(pattern),
+            'possible_words_before': game_state.possible_count_before,
+            'possible_words_after': game_state.possible_count_after,
             'is_correct': is_correct,
             'game_over': game_over,
             'won': is_correct,
-            'message': self.format_guess_result(word, results, len(game_state.possible_words_after))
+            'message': self.format_guess_result(word, pattern, game_state.possible_count_after)
         }
 
-    def format_guess_result(self, word: str, results: List[str], remaining_words: int) -> str:
+    def record_guess(self, word: str, pattern: int, replay: bool = False) -> 'GameState':
+        """
+        Add a guess and its feedback pattern code to the game, narrowing the possible words.
+        Replayed guesses, when a stored game is rebuilt, are not counted in the metrics again.
+        """
+        # Fold the feedback into what is known about the target, and filter the possible words
+        indexable = self.is_indexable(word)
+        new_constraints = self.current_constraints.apply(word, pattern) if indexable else self.current_constraints
+        if indexable and replay:
+            # A replayed game compiles its candidates straight from the constraints
+            new_candidates = self.current_candidates & new_constraints.candidate_mask(self.potential_lookup)
+        else:
+            new_candidates = self.filter_candidates(self.current_candidates, word, pattern)
+
+        # Create game state
+        self.current_guess += 1
+        self.state_version += 1
+        game_state = GameState(
+            guess_number=self.current_guess,
+            word_guessed=word,
+            pattern=pattern,
+            candidates_before=self.current_candidates,
+            candidates_after=new_candidates,
+            constraints=new_constraints,
+            version=self.state_version
+        )
+
+        self.game_history.append(game_state)
+        self.current_candidates = new_candidates
+        if metrics.ENABLED and not replay:
+            metrics.CANDIDATES.observe(game_state.possible_count_after)
+        return game_state
+
+    def format_guess_result(self, word: str, pattern: int, remaining_words: int) -> str:
         """Format the guess result for display."""
         result_symbols = {
             'CORRECT': '🟩',
@@ -234,7 +348,7 @@ class WordleSolver:
             'INCORRECT': '⬜'
         }
 
-        visual = ''.join(result_symbols[result] for result in results)
+        visual = ''.join(result_symbols[result] for result in decode_pattern(pattern))
         return f"Guess {self.current_guess}: {word} {visual} - {remaining_words} words remaining"
 
     def undo_to_guess(self, guess_number: int) -> bool:
@@ -245,20 +359,125 @@ class WordleSolver:
         # Reset to the state after the specified guess
         target_state = self.game_history[guess_number]
         self.current_guess = guess_number
-        self.current_possible_words = set(target_state.possible_words_after)
+        self.current_candidates = target_state.candidates_after
 
         # Remove later states from history
-        self.game_history = self.game_history[:guess_number + 1]
+        del self.game_history[guess_number + 1:]
+        self.state_version += 1
+        self.history_version = self.state_version
 
         return True
 
-    def get_computer_guess(self) -> str:
-        """Get the computer's optimal guess."""
-        return self.calculate_optimal_guess(self.current_possible_words)
+    def get_tree_guess(self) -> Optional[str]:
+        """Get the next guess from the decision tree, or None once the game has left it."""
+        path = []
+        for state in self.game_history[1:]:
+            if state.word_guessed not in self.guess_index:
+                return None
+            path.append((self.guess_index[state.word_guessed], state.pattern))
+        return self.word_data.tree_guess(path)
+
+    @metrics.timed('get_computer_guess')
+    def get_computer_guess(self, mode: str = 'greedy') -> str:
+        """
+        Get the computer's optimal guess, from the decision tree when the game is still on it.
+        In 'lookahead' mode, candidate sets small enough for it are searched several guesses deep.
+        """
+        if mode not in SOLVER_MODES:
+            raise ValueError(f"Unknown solver mode: {mode!r}")
+        if mode == 'lookahead' and self.current_possible_count <= LOOKAHEAD_MAX_CANDIDATES:
+            return self.word_data.lookahead_guess(self.current_candidates, self.current_constraints)[0]
+
+        guess = self.get_tree_guess()
+        if guess is not None:
+            return guess
+        return self.calculate_optimal_guess_for_mask(self.current_candidates, self.current_constraints)
+
+    def search_computer_guess(self) -> Iterator[Dict]:
+        """
+        Anytime search for the computer's guess, yielding the best guess so far as it goes.
+        The current position is captured now, so the iterator is safe to drain after the game moves on.
+        """
+        guess = self.get_tree_guess()
+        if guess is not None:
+            return iter([{'guess': guess, 'expected_remaining': None, 'searched': 1.0, 'complete': True}])
+        return self.word_data.optimal_guess_progress(self.current_candidates, self.current_constraints)
+
+    def get_computer_guess_within(self, budget_seconds: float) -> Dict:
+        """Get the best computer guess found within a time budget."""
+        deadline = time.monotonic() + budget_seconds
+        progress = None
+        for progress in self.search_computer_guess():
+            if time.monotonic() >= deadline:
+                break
+        return progress
+
+    def solve(self, target: str, mode: str = 'greedy') -> Dict:
+        """Play a new game against `target` using only computer guesses and report the outcome."""
+        self.reset_game(target)
+        guesses = []
+        result = {'won': False}
+        while self.current_possible_count > 0:
+            guess = self.get_computer_guess(mode)
+            result = self.make_guess(guess, is_user_guess=False)
+            guesses.append(guess)
+            if result['game_over']:
+                break
+
+        return {'target': self.target_word, 'guesses': guesses, 'won': result['won']}
+
+    def solve_history(self, history, mode: str = 'greedy') -> Dict:
+        """
+        Replay (guess, feedback) pairs from a game played elsewhere and suggest the next guess.
+        Feedback may be a list of result names or a string such as "02110" or "BGYYB".
+        """
+        self.reset_game()
+        self.target_word = ""
+        for guess, feedback in history:
+            guess = str(guess).upper()
+            if not self.is_indexable(guess):
+                raise ValueError(f"Invalid guess: {guess!r}")
+            self.record_guess(guess, parse_feedback(feedback))
+
+        solved = self.game_history[-1].pattern == ALL_CORRECT
+        guess = None
+        if not solved and self.current_possible_count > 0:
+            guess = self.get_computer_guess(mode)
+
+        return {
+            'history': [[state.word_guessed, state.letter_results] for state in self.get_game_history()],
+            'possible_words_count': self.current_possible_count,
+            'solved': solved,
+            'guess': guess
+        }
+
+    def solve_item(self, item, mode: str = 'greedy') -> Dict:
+        """Solve one batch item: a target word, or a list of (guess, feedback) pairs."""
+        try:
+            if isinstance(item, str):
+                if not self.is_potential(item):
+                    raise ValueError(f"'{item.upper()}' is not in the potential words list.")
+                return self.solve(item, mode)
+            return self.solve_history(item, mode)
+        except (TypeError, ValueError) as e:
+            return {'error': str(e)}
+
+    def solve_batch(self, items: Iterable, mode: str = 'greedy') -> Iterator[Dict]:
+        """
+        Solve many batch items against the shared word data without touching this game,
+        yielding each result, tagged with its item's `index`, as soon as it is ready.
+        Items are spread over the process pool when word_data.enable_parallel() was called,
+        in which case results may arrive out of order.
+        """
+        if self.word_data.parallel_scorer is not None:
+            return self.word_data.parallel_scorer.solve_batch(items, mode)
+        scratch = WordleSolver(word_data=self.word_data)
+        return (dict(scratch.solve_item(item, mode), index=index) for index, item in enumerate(items))
 
     def toggle_answer_visibility(self):
         """Toggle whether the answer is shown."""
         self.show_answer = not self.show_answer
+        self.state_version += 1
 
     def get_game_status(self) -> Dict:
         """Get current game status."""
@@ -267,7 +486,7 @@ class WordleSolver:
             'max_guesses': self.max_guesses,
             'target_word': self.target_word if self.show_answer else "Hidden",
             'show_answer': self.show_answer,
-            'possible_words_count': len(self.current_possible_words),
+            'possible_words_count': self.current_possible_count,
             'game_over': self.current_guess >= self.max_guesses or
                          (len(self.game_history) > 1 and
                           self.game_history[-1].word_guessed == self.target_word)
@@ -281,23 +500,89 @@ class WordleSolver:
         if guess_number < 0 or guess_number >= len(self.game_history):
             return set()
 
-        return self.game_history[guess_number].possible_words_after
+        return self.words_from_mask(self.game_history[guess_number].candidates_after)
+
+    def sorted_possible_words(self, guess_number: int = None) -> List[str]:
+        """Possible words after a guess (default: now) in alphabetical order, sorted once per state."""
+        if guess_number is None:
+            guess_number = len(self.game_history) - 1
+        if guess_number < 0 or guess_number >= len(self.game_history):
+            return []
+
+        state = self.game_history[guess_number]
+        if state.sorted_words is None:
+            state.sorted_words = sorted(self.potential_words[i] for i in
+                                        mask_to_indices(state.candidates_after, len(self.potential_words)))
+        return state.sorted_words
+
+    def history_since(self, version: Optional[int]):
+        """
+        Return (start, states): the history entries added after `version`, and the position
+        in get_game_history() they start at. Everything is returned, from position 0, when the
+        version is unknown or entries were removed since.
+        """
+        history = self.get_game_history()
+        if version is None or version < self.history_version or version > self.state_version:
+            return 0, history
+        start = len(history)
+        while start > 0 and history[start - 1].version > version:
+            start -= 1
+        return start, history[start:]
 
     def get_game_history(self) -> List:
         """Get the game history."""
         return self.game_history[1:]  # Skip initial state
 
+    def to_record(self) -> Dict:
+        """JSON-friendly record of the game, from which restore() rebuilds it."""
+        return {
+            'target_word': self.target_word,
+            'show_answer': self.show_answer,
+            'max_guesses': self.max_guesses,
+            'version': self.state_version,
+            'history_version': self.history_version,
+            'guesses': [[state.word_guessed, state.pattern, state.version] for state in self.get_game_history()]
+        }
+
+    def restore(self, record: Dict):
+        """Rebuild the game from a to_record() record by replaying its guesses and feedback."""
+        self.reset_game(record['target_word'] or None)
+        self.target_word = record['target_word']
+        self.show_answer = record['show_answer']
+        self.max_guesses = record['max_guesses']
+        for word, pattern, version in record['guesses']:
+            self.record_guess(word, pattern, replay=True).version = version
+        self.state_version = record['version']
+        self.history_version = record['history_version']
+
 
 class GameState:
     """Represents the state of the game at a particular guess."""
 
-    def __init__(self, guess_number: int, word_guessed: str, letter_results: List[str],
-                 possible_words_before: Set[str], possible_words_after: Set[str]):
+    __slots__ = ('guess_number', 'word_guessed', 'pattern', 'candidates_before', 'candidates_after',
+                 'possible_count_before', 'possible_count_after', 'constraints', 'version', 'sorted_words')
+
+    def __init__(self, guess_number: int, word_guessed: str, pattern: Optional[int],
+                 candidates_before: int, candidates_after: int, constraints: Constraints, version: int = 0):
         self.guess_number = guess_number
         self.word_guessed = word_guessed
-        self.letter_results = letter_results
-        self.possible_words_before = possible_words_before
-        self.possible_words_after = possible_words_after
+        # Feedback as a base-3 pattern code, None for the initial state
+        self.pattern = pattern
+        # Candidate bitsets over WordleSolver.potential_words, with their sizes cached
+        self.candidates_before = candidates_before
+        self.candidates_after = candidates_after
+        self.possible_count_before = candidates_before.bit_count()
+        self.possible_count_after = candidates_after.bit_count()
+        # Accumulated constraints after this guess
+        self.constraints = constraints
+        # Game state version that added this entry, and the possible words once sorted for display
+        self.version = version
+        self.sorted_words = None
+
+    @property
+    def letter_results(self) -> List[str]:
+        """The feedback as result names, for display."""
+        return decode_pattern(self.pattern) if self.pattern is not None else []
 
 
 def main():
@@ -340,14 +625,14 @@ def main():
                 print(f"❌ {result['message']}")
 
         elif choice == '2':
-            if len(solver.current_possible_words) == 0:
+            if solver.current_possible_count == 0:
                 print("No possible words remaining!")
             else:
                 optimal_guess = solver.get_computer_guess()
                 print(f"💡 Computer's optimal guess: {optimal_guess}")
 
         elif choice == '3':
-            if len(solver.current_possible_words) == 0:
+            if solver.current_possible_count == 0:
                 print("No possible words remaining!")
             else:
                 optimal_guess = solver.get_computer_guess()
@@ -379,7 +664,7 @@ def main():
                 print("🎮 New game started with random word!")
             elif sub_choice == '2':
                 word = input("Enter the target word: ").strip().upper()
-                if len(word) == 5 and word in [w.upper() for w in solver.potential_words]:
+                if len(word) == 5 and solver.is_potential(word):
                     solver.reset_game(word)
                     print(f"🎮 New game started!")
                 else:
@@ -430,7 +715,7 @@ def main():
                     }
                     visual = ''.join(result_symbols.get(r, '❓') for r in state.letter_results)
                     print(f"Guess {state.guess_number}: {state.word_guessed} {visual} "
-                          f"({len(state.possible_words_before)} → {len(state.possible_words_after)} words)")
+                          f"({state.possible_count_before} → {state.possible_count_after} words)")
 
         elif choice == '9':
             history = solver.get_game_history()
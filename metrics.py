@@ -0,0 +1,152 @@
+import bisect
+import cProfile
+import os
+import random
+import threading
+import time
+from functools import wraps
+from typing import Callable, Dict, List, Optional
+
+# Read once at import: with metrics off, timed() hands back the undecorated function
+ENABLED = bool(os.environ.get('WORDLE_METRICS'))
+
+# Fraction of requests to run under cProfile (0 = never), and where their stats are written
+PROFILE_SAMPLE = float(os.environ.get('WORDLE_PROFILE_SAMPLE', 0))
+PROFILE_DIR = os.environ.get('WORDLE_PROFILE_DIR', 'profiles')
+
+LATENCY_BUCKETS = [0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0]
+SIZE_BUCKETS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2500, 5000]
+
+
+class Histogram:
+    """Prometheus-style cumulative histogram, optionally split by one label."""
+
+    def __init__(self, name: str, help_text: str, buckets: List[float], label: str = None):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self.label = label
+        self._series: Dict[Optional[str], List] = {}  # label value -> [bucket counts, sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, label_value: str = None):
+        """Record one observation."""
+        with self._lock:
+            series = self._series.get(label_value)
+            if series is None:
+                series = self._series[label_value] = [[0] * len(self.buckets), 0.0, 0]
+            position = bisect.bisect_left(self.buckets, value)
+            if position < len(self.buckets):
+                series[0][position] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        """Exposition-format lines for this histogram."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for label_value, (counts, total, count) in sorted(self._series.items(), key=lambda item: str(item[0])):
+                prefix = f'{self.label}="{label_value}",' if self.label else ''
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+                lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {count}')
+                labels = f'{{{prefix[:-1]}}}' if prefix else ''
+                lines.append(f'{self.name}_sum{labels} {total}')
+                lines.append(f'{self.name}_count{labels} {count}')
+        return lines
+
+
+FUNCTION_SECONDS = Histogram('wordle_function_seconds', 'Time spent in solver hot-path functions.',
+                             LATENCY_BUCKETS, 'function')
+REQUEST_SECONDS = Histogram('wordle_request_seconds', 'HTTP request latency by route.', LATENCY_BUCKETS, 'route')
+CANDIDATES = Histogram('wordle_candidates_remaining', 'Possible words left after each guess.', SIZE_BUCKETS)
+HISTOGRAMS = [FUNCTION_SECONDS, REQUEST_SECONDS, CANDIDATES]
+
+# name -> (help text, type, callable returning the current value)
+_gauges: Dict[str, tuple] = {}
+_errors: Dict[str, int] = {}
+_errors_lock = threading.Lock()
+
+# Per-thread timings of the request being handled, reported in its Server-Timing header
+_request = threading.local()
+
+
+def timed(name: str) -> Callable:
+    """Decorator recording a function's run time under `name`; a no-op unless metrics are enabled."""
+    def decorate(function):
+        if not ENABLED:
+            return function
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                FUNCTION_SECONDS.observe(elapsed, name)
+                spans = getattr(_request, 'spans', None)
+                if spans is not None:
+                    spans[name] = spans.get(name, 0.0) + elapsed
+        return wrapper
+    return decorate
+
+
+def register_gauge(name: str, help_text: str, value: Callable[[], float], metric_type: str = 'gauge'):
+    """Export a value read at scrape time, e.g. a cache counter or the number of active games."""
+    _gauges[name] = (help_text, metric_type, value)
+
+
+def start_request():
+    """Begin timing (and possibly profiling) the current request."""
+    _request.start = time.perf_counter()
+    _request.spans = {}
+    _request.profiler = None
+    if PROFILE_SAMPLE and random.random() < PROFILE_SAMPLE:
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+            _request.profiler = profiler
+        except ValueError:
+            pass  # Another profiler is already running in this process
+
+
+def finish_request(route: str, status: int) -> str:
+    """Record the current request and return its Server-Timing header value."""
+    elapsed = time.perf_counter() - _request.start
+    spans, profiler = _request.spans, _request.profiler
+    _request.spans = _request.profiler = None
+
+    if profiler is not None:
+        profiler.disable()
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        slug = route.strip('/').replace('/', '_').replace('<', '').replace('>', '') or 'index'
+        profiler.dump_stats(os.path.join(PROFILE_DIR, f"{time.time():.6f}-{slug}.prof"))
+
+    if ENABLED:
+        REQUEST_SECONDS.observe(elapsed, route)
+        if status >= 500:
+            with _errors_lock:
+                _errors[route] = _errors.get(route, 0) + 1
+
+    timings = [f"total;dur={elapsed * 1000:.3f}"]
+    timings += [f"{name};dur={seconds * 1000:.3f}" for name, seconds in spans.items()]
+    return ', '.join(timings)
+
+
+def render() -> str:
+    """All metrics in the Prometheus text exposition format."""
+    lines = []
+    for histogram in HISTOGRAMS:
+        lines += histogram.render()
+
+    lines += ['# HELP wordle_request_errors_total Requests answered with a 5xx status.',
+              '# TYPE wordle_request_errors_total counter']
+    with _errors_lock:
+        lines += [f'wordle_request_errors_total{{route="{route}"}} {count}' for route, count in sorted(_errors.items())]
+
+    for name, (help_text, metric_type, value) in sorted(_gauges.items()):
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}", f"{name} {value()}"]
+    return '\n'.join(lines) + '\n'
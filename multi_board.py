@@ -0,0 +1,189 @@
+import random
+from typing import Dict, List, Optional
+
+import metrics
+from main import WordleSolver
+from patterns import ALL_CORRECT, decode_pattern
+from word_data import WordData
+
+# Named variants: number of boards and guesses allowed
+MULTI_BOARD_VARIANTS = {'dordle': (2, 7), 'quordle': (4, 9), 'octordle': (8, 13)}
+
+# Largest number of boards one game may have
+MAX_BOARDS = 32
+
+
+class MultiBoardGame:
+    """
+    Several Wordle boards played at once (Dordle, Quordle, Octordle...): every guess goes to
+    each board not yet solved. Each board is a WordleSolver over the same shared WordData,
+    and the computer's guess is scored jointly against every unsolved board.
+    """
+
+    def __init__(self, word_data: WordData = None, num_boards: int = 4, max_guesses: int = None):
+        self.word_data = word_data or WordData.load()
+        self.show_answer = False
+        self.boards: List[WordleSolver] = []
+        self.guesses: List[str] = []
+        self.reset_game(num_boards=num_boards, max_guesses=max_guesses)
+
+    def reset_game(self, targets: List[str] = None, num_boards: int = None, max_guesses: int = None):
+        """Start a new game, with the given targets or distinct random ones."""
+        num_boards = len(targets) if targets else num_boards or len(self.boards)
+        if not 1 <= num_boards <= MAX_BOARDS:
+            raise ValueError(f"Number of boards must be between 1 and {MAX_BOARDS}.")
+        if not targets:
+            targets = random.sample(self.word_data.potential_words, num_boards)
+        invalid = [target for target in targets if target.upper() not in self.word_data.potential_lookup]
+        if invalid:
+            raise ValueError(f"Not in the potential words list: {', '.join(invalid)}")
+
+        # One more guess than boards plus the usual spare guesses of a single game
+        self.max_guesses = max_guesses or num_boards + 5
+        self.guesses = []
+        self.boards = []
+        for target in targets:
+            board = WordleSolver(word_data=self.word_data)
+            board.reset_game(target.upper())
+            board.max_guesses = self.max_guesses
+            self.boards.append(board)
+
+    @property
+    def current_guess(self) -> int:
+        """Number of guesses made so far."""
+        return len(self.guesses)
+
+    def is_solved(self, board: WordleSolver) -> bool:
+        """Whether a board's target has been guessed; solved boards take no further guesses."""
+        return board.game_history[-1].pattern == ALL_CORRECT
+
+    def unsolved_boards(self) -> List[WordleSolver]:
+        """Boards still being played."""
+        return [board for board in self.boards if not self.is_solved(board)]
+
+    @property
+    def game_over(self) -> bool:
+        """Whether every board is solved or the guesses have run out."""
+        return not self.unsolved_boards() or self.current_guess >= self.max_guesses
+
+    def make_guess(self, word: str, is_user_guess: bool = True) -> Dict:
+        """Play a guess on every unsolved board and return each board's feedback."""
+        word = word.upper()
+        if is_user_guess and word not in self.word_data.acceptable_lookup:
+            return {'valid': False, 'message': f"'{word}' is not in the acceptable words list."}
+        if self.game_over:
+            return {'valid': False, 'message': "The game is over."}
+
+        self.guesses.append(word)
+        boards = []
+        for number, board in enumerate(self.boards):
+            if self.is_solved(board):
+                boards.append({'board': number, 'skipped': True, 'solved': True})
+                continue
+            result = board.make_guess(word, is_user_guess=False)
+            boards.append({
+                'board': number,
+                'skipped': False,
+                'pattern': result['pattern'],
+                'results': result['results'],
+                'possible_words_before': result['possible_words_before'],
+                'possible_words_after': result['possible_words_after'],
+                'solved': result['is_correct']
+            })
+
+        solved = sum(self.is_solved(board) for board in self.boards)
+        return {
+            'valid': True,
+            'guess_number': self.current_guess,
+            'word': word,
+            'boards': boards,
+            'solved_boards': solved,
+            'game_over': self.game_over,
+            'won': solved == len(self.boards),
+            'message': f"Guess {self.current_guess}: {word} - {solved}/{len(self.boards)} boards solved"
+        }
+
+    @metrics.timed('get_multi_board_guess')
+    def get_computer_guess(self) -> Optional[str]:
+        """
+        Get the guess minimizing the expected words left over all unsolved boards,
+        scored in one batched pass (see WordData.joint_guess()). None once nothing is left to guess.
+        """
+        boards = [board for board in self.unsolved_boards() if board.current_possible_count > 0]
+        if not boards:
+            return None
+        if len(boards) == 1:
+            return boards[0].get_computer_guess()
+        return self.word_data.joint_guess([board.current_candidates for board in boards],
+                                          [board.current_constraints for board in boards])[0]
+
+    def undo_to_guess(self, guess_number: int) -> bool:
+        """Undo to a specific guess number (0 = start of game) on every board."""
+        if guess_number < 0 or guess_number > self.current_guess:
+            return False
+        # Boards solved early have shorter histories, and are only rewound if the undo reaches their solve
+        for board in self.boards:
+            board.undo_to_guess(min(guess_number, len(board.game_history) - 1))
+        del self.guesses[guess_number:]
+        return True
+
+    def toggle_answer_visibility(self):
+        """Toggle whether the answers are shown."""
+        self.show_answer = not self.show_answer
+
+    def solve(self, targets: List[str]) -> Dict:
+        """Play a new game against `targets` using only computer guesses and report the outcome."""
+        self.reset_game(targets)
+        while not self.game_over:
+            guess = self.get_computer_guess()
+            if guess is None:
+                break
+            self.make_guess(guess, is_user_guess=False)
+        return {'targets': [board.target_word for board in self.boards], 'guesses': list(self.guesses),
+                'won': not self.unsolved_boards()}
+
+    def to_record(self) -> Dict:
+        """JSON-friendly record of the game, from which restore() rebuilds it."""
+        return {
+            'target_words': [board.target_word for board in self.boards],
+            'max_guesses': self.max_guesses,
+            'show_answer': self.show_answer,
+            'guesses': list(self.guesses)
+        }
+
+    def restore(self, record: Dict):
+        """Rebuild the game from a to_record() record by replaying its guesses."""
+        self.reset_game(record['target_words'], max_guesses=record['max_guesses'])
+        self.show_answer = record['show_answer']
+        for word in record['guesses']:
+            for board in self.unsolved_boards():
+                board.record_guess(word, board.evaluate_pattern(word, board.target_word), replay=True)
+            self.guesses.append(word)
+
+    def get_board_status(self, number: int) -> Dict:
+        """Status of one board."""
+        board = self.boards[number]
+        solved_at = next((state.guess_number for state in board.get_game_history()
+                          if state.pattern == ALL_CORRECT), None)
+        return {
+            'board': number,
+            'target_word': board.target_word if self.show_answer else "Hidden",
+            'possible_words_count': board.current_possible_count,
+            'solved': solved_at is not None,
+            'solved_at': solved_at,
+            'history': [{'word_guessed': state.word_guessed, 'pattern': state.pattern,
+                         'letter_results': decode_pattern(state.pattern)} for state in board.get_game_history()]
+        }
+
+    def get_game_status(self) -> Dict:
+        """Get current game status."""
+        return {
+            'num_boards': len(self.boards),
+            'current_guess': self.current_guess,
+            'max_guesses': self.max_guesses,
+            'guesses': list(self.guesses),
+            'show_answer': self.show_answer,
+            'boards': [self.get_board_status(number) for number in range(len(self.boards))],
+            'game_over': self.game_over,
+            'won': not self.unsolved_boards()
+        }
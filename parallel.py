@@ -0,0 +1,106 @@
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from scoring import best_partition_sum
+
+# Batch items handed to a worker per task, amortizing the pickling round trip
+BATCH_CHUNK_SIZE = 16
+
+# Word data inherited by each forked worker; the pattern matrix stays memory-mapped,
+# so every worker reads the same physical pages instead of holding its own copy
+_worker_data = None
+_worker_solver = None
+
+
+def _init_worker(word_data):
+    """Remember the shared word data inside a pool worker."""
+    global _worker_data
+    _worker_data = word_data
+    # The forked copy must never try to use the parent's pool
+    _worker_data.parallel_scorer = None
+
+
+def _score_shard(candidates: np.ndarray, guesses: np.ndarray) -> Tuple[int, int]:
+    """Return (sum of squared partition sizes, guess row) of the best guess in the shard."""
+    best_row, best_sum = best_partition_sum(_worker_data.pattern_matrix, candidates, guesses)
+    return best_sum, best_row
+
+
+def _solve_chunk(chunk: List[Tuple[int, object]], mode: str) -> List[Dict]:
+    """Solve (index, item) pairs with this worker's scratch game."""
+    global _worker_solver
+    if _worker_solver is None:
+        from main import WordleSolver
+        _worker_solver = WordleSolver(word_data=_worker_data)
+    return [dict(_worker_solver.solve_item(item, mode), index=index) for index, item in chunk]
+
+
+def chunked(items: Iterable, size: int) -> Iterator[List[Tuple[int, object]]]:
+    """Number the items and group them into lists of up to `size` (index, item) pairs."""
+    chunk = []
+    for pair in enumerate(items):
+        chunk.append(pair)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _ready() -> bool:
+    """No-op task used to launch the workers up front."""
+    return _worker_data is not None
+
+
+class ParallelScorer:
+    """Shards the acceptable-word guess space across a reusable process pool."""
+
+    def __init__(self, word_data, workers: int = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.num_guesses = len(word_data.acceptable_words)
+        # Fork so workers inherit the already-loaded word data rather than reloading it
+        self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                            mp_context=multiprocessing.get_context('fork'),
+                                            initializer=_init_worker, initargs=(word_data,))
+        # Launch every worker now, before the web server starts any threads
+        self.executor.submit(_ready).result()
+
+    def best_guess(self, candidates: np.ndarray, guesses: np.ndarray = None) -> Tuple[int, float]:
+        """
+        Find the guess row with the lowest expected remaining words.
+        Shard results are merged on (score, row), so ties go to the earliest guess
+        exactly as in the serial search, whatever order the shards finish in.
+        """
+        if guesses is None:
+            guesses = np.arange(self.num_guesses)
+        futures = [self.executor.submit(_score_shard, candidates, shard)
+                   for shard in np.array_split(guesses, self.workers) if len(shard)]
+        best_sum, best_index = min(future.result() for future in futures)
+        return best_index, best_sum / len(candidates)
+
+    def solve_batch(self, items: Iterable, mode: str = 'greedy') -> Iterator[Dict]:
+        """
+        Solve batch items across the pool, yielding each result as its chunk finishes.
+        Only a couple of chunks per worker are in flight, so memory stays flat
+        however long the (possibly lazy) input is.
+        """
+        chunks = chunked(items, BATCH_CHUNK_SIZE)
+        pending = set()
+        while True:
+            for chunk in chunks:
+                pending.add(self.executor.submit(_solve_chunk, chunk, mode))
+                if len(pending) >= 2 * self.workers:
+                    break
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        self.executor.shutdown(cancel_futures=True)
@@ -0,0 +1,164 @@
+import argparse
+import hashlib
+import os
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+# Per-letter feedback digits; a pattern code is sum(digit * 3 ** position)
+INCORRECT = 0
+WRONG_POSITION = 1
+CORRECT = 2
+
+RESULT_NAMES = ['INCORRECT', 'WRONG_POSITION', 'CORRECT']
+RESULT_DIGITS = {name: digit for digit, name in enumerate(RESULT_NAMES)}
+
+# Single-character feedback spellings accepted from clients: digits, or Black/Yellow/Green tiles
+FEEDBACK_CHARS = {'0': 'INCORRECT', '1': 'WRONG_POSITION', '2': 'CORRECT',
+                  'B': 'INCORRECT', 'Y': 'WRONG_POSITION', 'G': 'CORRECT'}
+
+NUM_PATTERNS = 3 ** 5
+ALL_CORRECT = NUM_PATTERNS - 1
+
+# Guess rows evaluated per vectorized block while building the matrix
+BUILD_CHUNK_SIZE = 512
+
+
+def encode_pattern(results: List[str]) -> int:
+    """Convert a list of result names into a base-3 pattern code."""
+    code = 0
+    for i, result in enumerate(results):
+        code += RESULT_DIGITS[result] * 3 ** i
+    return code
+
+
+def decode_pattern(code: int) -> List[str]:
+    """Convert a base-3 pattern code back into a list of result names."""
+    results = []
+    for _ in range(5):
+        results.append(RESULT_NAMES[code % 3])
+        code //= 3
+    return results
+
+
+def parse_feedback(feedback) -> int:
+    """
+    Read feedback given as a list of result names or as a 5-character string
+    such as "02110" or "BGYYB" into a pattern code. Raises ValueError if it is neither.
+    """
+    if isinstance(feedback, str):
+        results = [FEEDBACK_CHARS.get(char) for char in feedback.upper()]
+    else:
+        results = [result if result in RESULT_DIGITS else None for result in feedback]
+    if len(results) != 5 or None in results:
+        raise ValueError(f"Invalid feedback: {feedback!r}")
+    return encode_pattern(results)
+
+
+def words_to_array(words: List[str]) -> np.ndarray:
+    """Encode upper-case 5-letter words as an (N, 5) array of letter numbers 0-25."""
+    if not words:
+        return np.zeros((0, 5), dtype=np.uint8)
+    raw = np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8)
+    return (raw.reshape(len(words), 5) - ord('A')).astype(np.uint8)
+
+
+def build_pattern_matrix(guesses: List[str], answers: List[str]) -> np.ndarray:
+    """Compute the pattern code of every guess against every answer."""
+    guess_letters = words_to_array(guesses)
+    answer_letters = words_to_array(answers)
+    num_answers = len(answers)
+    matrix = np.zeros((len(guesses), num_answers), dtype=np.uint8)
+    answer_range = np.arange(num_answers)
+
+    for start in range(0, len(guesses), BUILD_CHUNK_SIZE):
+        block = guess_letters[start:start + BUILD_CHUNK_SIZE]
+        rows = np.arange(len(block))[:, None]
+        green = block[:, None, :] == answer_letters[None, :, :]
+
+        # Letters of each answer still available for yellows once greens are used
+        available = np.zeros((len(block), num_answers, 26), dtype=np.uint8)
+        for i in range(5):
+            available[:, answer_range, answer_letters[:, i]] += ~green[:, :, i]
+
+        codes = np.zeros((len(block), num_answers), dtype=np.uint8)
+        for i in range(5):
+            letter = block[:, i][:, None]
+            yellow = ~green[:, :, i] & (available[rows, answer_range, letter] > 0)
+            available[rows, answer_range, letter] -= yellow
+            codes += (green[:, :, i] * CORRECT + yellow * WRONG_POSITION).astype(np.uint8) * 3 ** i
+
+        matrix[start:start + len(block)] = codes
+
+    return matrix
+
+
+def word_files_digest(potential_file: str, acceptable_file: str) -> Optional[str]:
+    """Hash both word list files, or return None if either is missing."""
+    digest = hashlib.sha256()
+    for filename in (potential_file, acceptable_file):
+        try:
+            with open(filename, 'rb') as f:
+                digest.update(f.read())
+        except FileNotFoundError:
+            return None
+        digest.update(b'\0')
+    return digest.hexdigest()[:16]
+
+
+def derived_file(potential_file: str, acceptable_file: str, prefix: str, suffix: str) -> Optional[str]:
+    """
+    Path of a file derived from these word lists, kept next to them and named
+    `<prefix>-<digest><suffix>` so it is ignored once either list changes.
+    None if the lists are not on disk.
+    """
+    digest = word_files_digest(potential_file, acceptable_file)
+    if digest is None:
+        return None
+    return os.path.join(os.path.dirname(os.path.abspath(potential_file)), f"{prefix}-{digest}{suffix}")
+
+
+def parse_build_args(parser: argparse.ArgumentParser,
+                     path_for: Callable[[str, str], Optional[str]]) -> Tuple[argparse.Namespace, Optional[str]]:
+    """
+    Add the word list options to a build script's parser, parse the command line, and
+    return the arguments with the path of the file to build (None, after an error
+    message, if the word lists are missing).
+    """
+    parser.add_argument('--potential', default='potential.txt', help="Potential answers file")
+    parser.add_argument('--acceptable', default='acceptable.txt', help="Acceptable guesses file")
+    args = parser.parse_args()
+    path = path_for(args.potential, args.acceptable)
+    if path is None:
+        print("❌ Word list files not found.")
+    return args, path
+
+
+def load_pattern_matrix(potential_file: str, acceptable_file: str,
+                        guesses: List[str], answers: List[str]) -> np.ndarray:
+    """
+    Load the guess x answer pattern matrix, building and caching it if needed.
+    The cache lives next to the word lists and is memory-mapped read-only.
+    """
+    cache_file = derived_file(potential_file, acceptable_file, 'patterns', '.npy')
+    if cache_file is None:
+        return build_pattern_matrix(guesses, answers)
+
+    if os.path.exists(cache_file):
+        try:
+            matrix = np.load(cache_file, mmap_mode='r')
+            if matrix.shape == (len(guesses), len(answers)):
+                return matrix
+        except (OSError, ValueError):
+            pass
+
+    matrix = build_pattern_matrix(guesses, answers)
+    try:
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'wb') as f:
+            np.save(f, matrix)
+        os.replace(temp_file, cache_file)
+        return np.load(cache_file, mmap_mode='r')
+    except OSError:
+        print(f"Warning: could not write pattern cache {cache_file}.")
+        return matrix
@@ -0,0 +1,29 @@
+import os
+import sqlite3
+
+# Seconds a query waits for another process's write to the same database file
+SQLITE_TIMEOUT = 10
+
+
+class ProcessConnection:
+    """
+    Lazily opened SQLite connection for one database file, shared by the threads of a
+    process and reopened after a fork, so every server worker has its own. The file is
+    put in WAL mode, so readers in other processes are not blocked while one writes.
+    """
+
+    def __init__(self, path: str, *schema: str):
+        self.path = path
+        self.schema = schema  # Statements run on every new connection, e.g. CREATE TABLE IF NOT EXISTS
+        self._db = None
+        self._pid = None
+
+    def connection(self) -> sqlite3.Connection:
+        """SQLite connection for this process."""
+        if self._db is None or self._pid != os.getpid():
+            self._db = sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            for statement in self.schema:
+                self._db.execute(statement)
+            self._pid = os.getpid()
+        return self._db
@@ -0,0 +1,173 @@
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from patterns import ALL_CORRECT, NUM_PATTERNS
+
+# Bump when the solver's choice of guess changes, so stale decision trees and persistent guess caches are ignored
+SOLVER_VERSION = 1
+
+# Guess rows scored per bincount pass; bounds the temporary arrays to a few MB
+SCORE_CHUNK_SIZE = 256
+
+# Up to this many candidates, signatures are gathered with a single outer index
+GATHER_MAX_CANDIDATES = 64
+
+# Up to this many candidates, guesses with identical feedback signatures are scored once
+# (243 ** 8 still fits in an unsigned 64-bit key)
+DEDUPE_MAX_CANDIDATES = 8
+
+# Pattern codes gathered per bincount pass when scoring several boards at once
+JOINT_CHUNK_CELLS = SCORE_CHUNK_SIZE * 2048
+
+
+def guess_signatures(pattern_matrix: np.ndarray, candidates: np.ndarray,
+                     guesses: Optional[np.ndarray] = None) -> np.ndarray:
+    """Return the (guesses, candidates) block of pattern codes, picking the cheapest gather."""
+    if guesses is None:
+        return pattern_matrix[:, candidates]
+    if len(candidates) <= GATHER_MAX_CANDIDATES:
+        return pattern_matrix[np.ix_(guesses, candidates)]
+    return pattern_matrix[guesses][:, candidates]
+
+
+def signature_sums(signatures: np.ndarray) -> np.ndarray:
+    """Return the sum of squared partition sizes for each row of a block of pattern codes."""
+    num_rows = len(signatures)
+    offsets = signatures.astype(np.intp)
+    offsets += (np.arange(num_rows, dtype=np.intp) * NUM_PATTERNS)[:, None]
+    counts = np.bincount(offsets.ravel(), minlength=num_rows * NUM_PATTERNS)
+    counts = counts.reshape(num_rows, NUM_PATTERNS)
+    return np.einsum('ij,ij->i', counts, counts)
+
+
+def partition_sums(pattern_matrix: np.ndarray, candidates: np.ndarray,
+                   guesses: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Return the sum of squared partition sizes each guess induces on the candidates.
+    Dividing by len(candidates) gives the expected number of remaining words.
+    """
+    signatures = guess_signatures(pattern_matrix, candidates, guesses)
+    sums = np.empty(len(signatures), dtype=np.int64)
+    for start in range(0, len(signatures), SCORE_CHUNK_SIZE):
+        block = signatures[start:start + SCORE_CHUNK_SIZE]
+        sums[start:start + len(block)] = signature_sums(block)
+    return sums
+
+
+def distinct_guesses(signatures: np.ndarray) -> np.ndarray:
+    """
+    Return the row positions of the earliest guess in each group of identical signatures.
+    Guesses that leave every candidate in one partition are dropped too, unless nothing else is left.
+    Signatures are packed exactly into one base-243 integer, so this needs <= DEDUPE_MAX_CANDIDATES columns.
+    """
+    place_values = np.uint64(NUM_PATTERNS) ** np.arange(signatures.shape[1], dtype=np.uint64)
+    keys = signatures.astype(np.uint64) @ place_values
+    _, first = np.unique(keys, return_index=True)
+    first.sort()
+    useful = first[(signatures[first] != signatures[first, :1]).any(axis=1)]
+    return useful if len(useful) else first[:1]
+
+
+def best_partition_sum(pattern_matrix: np.ndarray, candidates: np.ndarray,
+                       guesses: Optional[np.ndarray] = None) -> Tuple[int, int]:
+    """
+    Return (guess row, sum of squared partition sizes) of the earliest best guess.
+    Scoring runs block by block in guess order and stops as soon as a guess puts
+    every candidate in its own partition, since no guess can do better.
+    """
+    signatures = guess_signatures(pattern_matrix, candidates, guesses)
+    if guesses is None:
+        guesses = np.arange(pattern_matrix.shape[0])
+
+    if len(candidates) <= DEDUPE_MAX_CANDIDATES:
+        # Equivalent guesses share a score, so scoring each group's earliest member keeps the tie-break
+        keep = distinct_guesses(signatures)
+        guesses, signatures = guesses[keep], signatures[keep]
+
+    lower_bound = len(candidates)
+    best_row, best_sum = -1, None
+    for start in range(0, len(guesses), SCORE_CHUNK_SIZE):
+        sums = signature_sums(signatures[start:start + SCORE_CHUNK_SIZE])
+        best = int(np.argmin(sums))
+        if best_sum is None or sums[best] < best_sum:
+            best_row, best_sum = int(guesses[start + best]), int(sums[best])
+        if best_sum == lower_bound:
+            break
+
+    return best_row, best_sum
+
+
+def best_guess(pattern_matrix: np.ndarray, candidates: np.ndarray,
+               guesses: Optional[np.ndarray] = None) -> Tuple[int, float]:
+    """
+    Find the guess row with the lowest expected remaining words.
+    Ties go to the earliest guess, matching a linear scan in list order.
+    """
+    best_row, best_sum = best_partition_sum(pattern_matrix, candidates, guesses)
+    return best_row, best_sum / len(candidates)
+
+
+def anytime_search(pattern_matrix: np.ndarray, candidates: np.ndarray,
+                   order: np.ndarray) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    Score guesses block by block in the given priority order, yielding
+    (best row, best sum, guesses scored, guesses remaining) after each block.
+    The best is kept on (sum, row), so a run to completion matches best_partition_sum.
+    Once a guess reaches the lower bound only earlier rows, which could still win the
+    tie-break, are left to score.
+    """
+    lower_bound = len(candidates)
+    best_row, best_sum = -1, None
+    remaining = order
+    scored = 0
+
+    while len(remaining):
+        rows, remaining = remaining[:SCORE_CHUNK_SIZE], remaining[SCORE_CHUNK_SIZE:]
+        sums = signature_sums(guess_signatures(pattern_matrix, candidates, rows))
+        best = int(np.lexsort((rows, sums))[0])
+        if best_sum is None or (sums[best], rows[best]) < (best_sum, best_row):
+            best_row, best_sum = int(rows[best]), int(sums[best])
+        if best_sum == lower_bound:
+            remaining = remaining[remaining < best_row]
+        scored += len(rows)
+        yield best_row, best_sum, scored, len(remaining)
+
+
+def joint_scores(pattern_matrix: np.ndarray, boards: List[np.ndarray], guesses: np.ndarray,
+                 weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Return, for each guess, the expected number of words left summed over several boards,
+    leaving out boards the guess solves. Every board's candidates are gathered side by side
+    and counted in one bincount per block, each board's codes offset into its own 243 slots.
+    `weights` counts boards that share a candidate set, so each distinct set is scored once.
+    """
+    sizes = np.array([len(board) for board in boards])
+    weights = np.ones(len(boards)) if weights is None else np.asarray(weights, dtype=float)
+    columns = np.concatenate(boards)
+    board_offsets = np.repeat(np.arange(len(boards), dtype=np.intp) * NUM_PATTERNS, sizes)
+    slots = len(boards) * NUM_PATTERNS
+    block_size = max(1, JOINT_CHUNK_CELLS // len(columns))
+
+    scores = np.empty(len(guesses))
+    for start in range(0, len(guesses), block_size):
+        rows = guesses[start:start + block_size]
+        offsets = guess_signatures(pattern_matrix, columns, rows).astype(np.intp)
+        offsets += board_offsets
+        offsets += (np.arange(len(rows), dtype=np.intp) * slots)[:, None]
+        counts = np.bincount(offsets.ravel(), minlength=len(rows) * slots).reshape(len(rows), len(boards),
+                                                                                   NUM_PATTERNS)
+        # The all-correct group holds at most the guess itself, and leaves nothing to find on that board
+        sums = np.einsum('ijk,ijk->ij', counts, counts) - counts[:, :, ALL_CORRECT]
+        scores[start:start + len(rows)] = (sums / sizes) @ weights
+    return scores
+
+
+def best_joint_guess(pattern_matrix: np.ndarray, boards: List[np.ndarray], guesses: Optional[np.ndarray] = None,
+                     weights: Optional[np.ndarray] = None) -> Tuple[int, float]:
+    """Find the guess row with the lowest joint score (see joint_scores()); ties go to the earliest guess."""
+    if guesses is None:
+        guesses = np.arange(pattern_matrix.shape[0])
+    scores = joint_scores(pattern_matrix, boards, guesses, weights)
+    best = int(np.argmin(scores))
+    return int(guesses[best]), float(scores[best])
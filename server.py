@@ -0,0 +1,171 @@
+import argparse
+import os
+import random
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+# A worker that exits sooner than this after starting is assumed to be crashing, and is restarted after a pause
+MIN_WORKER_LIFETIME = 1.0
+
+# Seconds an idle keep-alive connection is held open; a stopping worker waits at most this long for its clients
+KEEPALIVE_TIMEOUT = 5
+
+
+class WorkerRequestHandler(WSGIRequestHandler):
+    """Request handler that drops idle connections, so they cannot hold up a worker's shutdown."""
+
+    timeout = KEEPALIVE_TIMEOUT
+
+
+class RequestLimit:
+    """WSGI wrapper that stops its worker's server once it has started `max_requests` requests."""
+
+    def __init__(self, app, max_requests: int):
+        self.app = app
+        self.max_requests = max_requests
+        self.server = None
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        with self._lock:
+            self._count += 1
+            last = self._count == self.max_requests
+        if last:
+            # shutdown() waits for serve_forever() to return, so it cannot run on a request thread
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        return self.app(environ, start_response)
+
+
+def run_worker(app, listener: socket.socket, max_requests: int):
+    """Serve requests from the shared listening socket until shut down or recycled."""
+    host, port = listener.getsockname()[:2]
+    if max_requests:
+        app = RequestLimit(app, max_requests)
+    server = make_server(host, port, app, threaded=True, request_handler=WorkerRequestHandler,
+                         fd=listener.fileno())
+    if max_requests:
+        app.server = server
+    # Let requests in flight finish before the worker exits
+    server.daemon_threads = False
+    signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=server.shutdown, daemon=True).start())
+    server.serve_forever()
+    server.server_close()
+
+
+def spawn_worker(app, listener: socket.socket, max_requests: int) -> int:
+    """Fork a worker process and return its pid."""
+    # Spread recycling out so the workers do not all restart at once
+    limit = max_requests + random.randint(0, max_requests // 10) if max_requests else 0
+    pid = os.fork()
+    if pid:
+        return pid
+
+    # Until run_worker() installs its own, SIGTERM simply ends the worker; SIGINT is for the master alone
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    code = 0
+    try:
+        run_worker(app, listener, limit)
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def serve(app, host: str, port: int, workers: int, max_requests: int):
+    """
+    Pre-fork server: the caller has already loaded the app and its word data in this
+    master process; each forked worker shares those pages copy-on-write (the compiled
+    artifact and pattern matrix are memory-mapped, so they are shared outright) and
+    accepts connections from the one listening socket. Workers that exit are replaced
+    until the master gets SIGTERM or SIGINT.
+    """
+    listener = socket.create_server((host, port), backlog=128)
+    children = {}
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(workers):
+        children[spawn_worker(app, listener, max_requests)] = time.monotonic()
+    print(f"🚀 Serving on http://{host}:{port} with {workers} workers (master pid {os.getpid()})")
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started = children.pop(pid, None)
+        if started is None or stopping:
+            continue
+        if os.waitstatus_to_exitcode(status) != 0 and time.monotonic() - started < MIN_WORKER_LIFETIME:
+            print(f"Warning: worker {pid} exited right after starting; restarting it in {MIN_WORKER_LIFETIME} s.")
+            time.sleep(MIN_WORKER_LIFETIME)
+            if stopping:
+                continue
+        print(f"♻️  Worker {pid} exited, starting a replacement")
+        children[spawn_worker(app, listener, max_requests)] = time.monotonic()
+
+    listener.close()
+    print("👋 All workers stopped")
+
+
+def main():
+    """Load the solver once, then serve the app from several forked worker processes."""
+    parser = argparse.ArgumentParser(description="Serve the Wordle solver with pre-forked worker processes.")
+    parser.add_argument('--host', default='0.0.0.0', help="Interface to listen on")
+    parser.add_argument('--port', type=int, default=8000, help="Port to listen on")
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('WORDLE_SERVER_WORKERS', os.cpu_count() or 1)),
+                        help="Number of worker processes (default WORDLE_SERVER_WORKERS or the number of CPUs)")
+    parser.add_argument('--max-requests', type=int, default=int(os.environ.get('WORDLE_MAX_REQUESTS', 0)),
+                        help="Requests after which a worker is replaced by a fresh fork, plus up to 10%% "
+                             "jitter (default WORDLE_MAX_REQUESTS, 0 = never)")
+    parser.add_argument('--session-db', default=os.environ.get('WORDLE_SESSION_DB', 'sessions.sqlite3'),
+                        help="SQLite file holding every worker's games (default WORDLE_SESSION_DB or sessions.sqlite3)")
+    args = parser.parse_args()
+
+    # Games must live outside the workers, so any worker can serve any game
+    os.environ['WORDLE_SESSION_DB'] = args.session_db
+
+    # A process pool cannot be inherited across fork, and threads do not survive it
+    if os.environ.pop('WORDLE_WORKERS', None):
+        print("Warning: WORDLE_WORKERS is ignored by server.py; add server workers instead.")
+    warm_cache = os.environ.pop('WORDLE_WARM_CACHE', None)
+    # Speculated guesses only help a later request if every worker can read them
+    if os.environ.get('WORDLE_SPECULATE') and not os.environ.get('WORDLE_GUESS_CACHE'):
+        os.environ.pop('WORDLE_SPECULATE')
+        print("Warning: WORDLE_SPECULATE is turned off by server.py unless WORDLE_GUESS_CACHE shares the cache.")
+
+    start = time.perf_counter()
+    from app import app, word_data
+    if warm_cache:
+        # Warm once here, so every worker inherits the filled cache
+        from guess_cache import warm
+        warm(word_data)
+    print(f"📦 Loaded word data in {time.perf_counter() - start:.1f} s")
+
+    serve(app, args.host, args.port, args.workers, args.max_requests)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from main import WordleSolver
+from process_db import ProcessConnection
+
+
+# Seconds between last-access updates of a game that is only being read
+TOUCH_INTERVAL = 60
+
+
+class SessionConflict(Exception):
+    """Raised when saving a game that another request, possibly in another process, saved first."""
+
+
+class GameSession:
+    """A single player's game plus the lock that serializes requests for it."""
+
+    __slots__ = ('session_id', 'game', 'lock', 'last_access', 'stored')
+
+    def __init__(self, session_id: str, game: WordleSolver):
+        self.session_id = session_id
+        self.game = game
+        self.lock = threading.Lock()
+        self.last_access = time.monotonic()
+        # (revision, record JSON) as loaded from a shared store, None for in-memory sessions
+        self.stored: Optional[Tuple[int, str]] = None
+
+
+class SessionStore:
+    """
+    Thread-safe store of game sessions with LRU and idle-time eviction.
+    The store lock only guards the session table; games never share mutable state.
+    """
+
+    def __init__(self, game_factory: Callable[[], WordleSolver],
+                 max_sessions: int = 10000, ttl_seconds: float = 3600):
+        self.game_factory = game_factory
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self._sessions: 'OrderedDict[str, GameSession]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, session_id: Optional[str]) -> Tuple[GameSession, bool]:
+        """Return the session for this id, creating a new one if it is unknown or expired."""
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now)
+            session = self._sessions.get(session_id) if session_id else None
+            if session is not None:
+                session.last_access = now
+                self._sessions.move_to_end(session_id)
+                return session, False
+
+        # Build the game outside the lock; it only references the shared word data
+        session = GameSession(secrets.token_urlsafe(16), self.game_factory())
+        with self._lock:
+            self._sessions[session.session_id] = session
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session, True
+
+    def save(self, session: GameSession):
+        """Persist a session's game after a request; games held in memory need nothing."""
+
+    def remove(self, session_id: str) -> bool:
+        """Drop a session, returning whether it existed."""
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def _evict_expired(self, now: float):
+        """Drop sessions idle for longer than the TTL (oldest entries come first)."""
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if now - session.last_access <= self.ttl_seconds:
+                break
+            self._sessions.popitem(last=False)
+
+
+class SQLiteSessionStore:
+    """
+    Session store shared by every server process through one SQLite file, so a game's
+    requests may land on any worker. Each game is kept as its to_record() record and
+    rebuilt per request with `restore_game`, which replays the guesses. save() writes a game
+    back only if it changed, and raises SessionConflict if another request saved it first.
+    `kind` keeps different game types apart in the same file.
+    """
+
+    def __init__(self, path: str, kind: str, game_factory: Callable[[], object],
+                 restore_game: Callable[[Dict], object], max_sessions: int = 10000, ttl_seconds: float = 3600):
+        self.path = path
+        self.kind = kind
+        self.game_factory = game_factory
+        self.restore_game = restore_game
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._db = ProcessConnection(
+            path,
+            "CREATE TABLE IF NOT EXISTS sessions (session_id TEXT PRIMARY KEY, kind TEXT NOT NULL, "
+            "revision INTEGER NOT NULL, record TEXT NOT NULL, last_access REAL NOT NULL)",
+            "CREATE INDEX IF NOT EXISTS sessions_by_access ON sessions (kind, last_access)")
+
+    def get_or_create(self, session_id: Optional[str]) -> Tuple[GameSession, bool]:
+        """Return the session for this id rebuilt from the database, creating a new one if it is unknown or expired."""
+        now = time.time()
+        row = None
+        if session_id:
+            with self._lock:
+                row = self._db.connection().execute(
+                    "SELECT revision, record, last_access FROM sessions WHERE session_id = ? AND kind = ?",
+                    (session_id, self.kind)).fetchone()
+        if row is not None and now - row[2] <= self.ttl_seconds:
+            revision, record, last_access = row
+            session = GameSession(session_id, self.restore_game(json.loads(record)))
+            session.stored = (revision, record)
+            if now - last_access > TOUCH_INTERVAL:
+                with self._lock, self._db.connection() as db:
+                    db.execute("UPDATE sessions SET last_access = ? WHERE session_id = ?", (now, session_id))
+            return session, False
+
+        session = GameSession(secrets.token_urlsafe(16), self.game_factory())
+        record = json.dumps(session.game.to_record())
+        with self._lock, self._db.connection() as db:
+            db.execute("DELETE FROM sessions WHERE kind = ? AND last_access < ?", (self.kind, now - self.ttl_seconds))
+            db.execute("INSERT INTO sessions VALUES (?, ?, 0, ?, ?)", (session.session_id, self.kind, record, now))
+            db.execute("DELETE FROM sessions WHERE session_id IN (SELECT session_id FROM sessions WHERE kind = ? "
+                       "ORDER BY last_access DESC LIMIT -1 OFFSET ?)", (self.kind, self.max_sessions))
+        session.stored = (0, record)
+        return session, True
+
+    def save(self, session: GameSession):
+        """Write the session's game back if the request changed it."""
+        revision, stored_record = session.stored
+        record = json.dumps(session.game.to_record())
+        if record == stored_record:
+            return
+        with self._lock, self._db.connection() as db:
+            updated = db.execute("UPDATE sessions SET record = ?, revision = ?, last_access = ? "
+                                 "WHERE session_id = ? AND revision = ?",
+                                 (record, revision + 1, time.time(), session.session_id, revision)).rowcount
+        if not updated:
+            raise SessionConflict(session.session_id)
+        session.stored = (revision + 1, record)
+
+    def remove(self, session_id: str) -> bool:
+        """Drop a session, returning whether it existed."""
+        with self._lock, self._db.connection() as db:
+            return db.execute("DELETE FROM sessions WHERE session_id = ? AND kind = ?",
+                              (session_id, self.kind)).rowcount > 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.connection().execute("SELECT COUNT(*) FROM sessions WHERE kind = ? AND last_access >= ?",
+                                                 (self.kind, time.time() - self.ttl_seconds)).fetchone()[0]
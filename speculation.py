@@ -0,0 +1,97 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+
+import numpy as np
+
+from bitset import mask_from_indices, mask_to_indices
+from constraints import Constraints
+from main import WordleSolver
+from patterns import ALL_CORRECT
+
+
+class Speculation:
+    """One game's pending background work; cancelled when that game moves on."""
+
+    __slots__ = ('cancelled',)
+
+    def __init__(self):
+        self.cancelled = False
+
+
+class Speculator:
+    """
+    Precomputes the next-turn suggestions of a game in the background.
+    Results land in the shared optimal-guess cache, so a later "Get Optimal Guess"
+    for the same candidate set is a cache hit instead of a full search.
+    """
+
+    def __init__(self, word_data, workers: int = 1, budget_seconds: float = 2.0, max_pending: int = 32):
+        self.word_data = word_data
+        self.budget_seconds = budget_seconds
+        self.max_pending = max_pending
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='speculate')
+        self._speculations: Dict[str, Speculation] = {}  # session id -> its pending work
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def speculate(self, session_id: str, game: WordleSolver):
+        """
+        Queue precomputation for a game's current position. Work is tracked by session id,
+        since a game may be rebuilt for every request (see sessions.SQLiteSessionStore).
+        Must be called while holding the game's lock; only an immutable snapshot is handed off.
+        """
+        self.cancel(session_id)
+        if game.current_possible_count <= 2 or game.get_tree_guess() is not None:
+            return  # Nothing to search, or the decision tree already answers this branch
+
+        with self._lock:
+            if self._pending >= self.max_pending:
+                return  # Shed speculative work under load rather than queueing it
+            self._pending += 1
+            speculation = Speculation()
+            self._speculations[session_id] = speculation
+
+        self.executor.submit(self._run, session_id, speculation, game.current_candidates, game.current_constraints)
+
+    def cancel(self, session_id: str):
+        """Abandon any pending work for a game, e.g. after a reset or undo."""
+        with self._lock:
+            speculation = self._speculations.pop(session_id, None)
+        if speculation is not None:
+            speculation.cancelled = True
+
+    def _run(self, session_id: str, speculation: Speculation, candidates: int, constraints: Constraints):
+        """Compute the current suggestion, then the best reply to each feedback it can get."""
+        try:
+            deadline = time.monotonic() + self.budget_seconds
+            if speculation.cancelled:
+                return
+            guess = self.word_data.optimal_guess(candidates, constraints)
+            if guess not in self.word_data.guess_index:
+                return
+
+            num_answers = len(self.word_data.potential_words)
+            indices = mask_to_indices(candidates, num_answers)
+            codes = np.asarray(self.word_data.pattern_matrix[self.word_data.guess_index[guess], indices])
+            patterns, counts = np.unique(codes, return_counts=True)
+
+            # Largest branches first: they are the most likely feedback and the slowest to search
+            for code in patterns[np.argsort(-counts, kind='stable')]:
+                if speculation.cancelled or time.monotonic() > deadline:
+                    return
+                subset = indices[codes == code]
+                if code == ALL_CORRECT or len(subset) <= 2:
+                    continue
+                self.word_data.optimal_guess(mask_from_indices(subset),
+                                             constraints.apply(guess, int(code)))
+        finally:
+            with self._lock:
+                self._pending -= 1
+                if self._speculations.get(session_id) is speculation:
+                    del self._speculations[session_id]
+
+    def shutdown(self):
+        """Stop the background threads, dropping queued work."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -3,6 +3,27 @@ let currentRow = 0;
 let currentTile = 0;
 let gameOver = false;
 
+// Longest the server may search for an optimal guess before answering with its best so far
+const OPTIMAL_GUESS_BUDGET_MS = 2000;
+
+// Possible words fetched per "Load more" click
+const POSSIBLE_WORDS_PAGE_SIZE = 200;
+
+// Last snapshot of the game received from the server, kept current by refreshState()
+const gameState = { version: null, etag: null, status: null, history: [] };
+
+// Feedback arrives as a base-3 pattern code: digit i (0, 1, 2) is the result for letter i
+const RESULT_NAMES = ['INCORRECT', 'WRONG_POSITION', 'CORRECT'];
+
+function decodePattern(code) {
+    const results = [];
+    for (let i = 0; i < 5; i++) {
+        results.push(RESULT_NAMES[code % 3]);
+        code = Math.floor(code / 3);
+    }
+    return results;
+}
+
 // DOM elements
 const board = document.getElementById('board');
 const wordInput = document.getElementById('wordInput');
@@ -76,11 +97,28 @@ function setupEventListeners() {
     document.getElementById('undoToStart').addEventListener('click', () => undoToGuess(0));
 }
 
+// Bring gameState up to date with one small request: 304 when nothing changed,
+// otherwise the status plus only the history entries added since our version
+async function refreshState() {
+    const query = gameState.version === null ? '' : `?since=${gameState.version}`;
+    const headers = gameState.etag ? { 'If-None-Match': gameState.etag } : {};
+    const response = await fetch(`/api/game/snapshot${query}`, { headers: headers });
+    if (response.status === 304) {
+        return gameState;
+    }
+
+    const snapshot = await response.json();
+    gameState.version = snapshot.version;
+    gameState.etag = response.headers.get('ETag');
+    gameState.status = snapshot.status;
+    gameState.history = gameState.history.slice(0, snapshot.history_start).concat(snapshot.history);
+    return gameState;
+}
+
 async function loadGameStatus() {
     try {
-        const response = await fetch('/api/game/status');
-        const status = await response.json();
-        updateGameStatus(status);
+        await refreshState();
+        updateGameStatus(gameState.status);
         updateBoardFromHistory();
     } catch (error) {
         showMessage('Error loading game status', 'error');
@@ -95,7 +133,7 @@ async function submitUserGuess() {
     }
 
     try {
-        const response = await fetch('/api/game/guess', {
+        const response = await fetch('/api/game/guess?compact=1', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -129,24 +167,47 @@ async function submitUserGuess() {
     }
 }
 
-async function getOptimalGuess() {
-    try {
-        const response = await fetch('/api/game/optimal-guess');
-        const result = await response.json();
-        
+function getOptimalGuess() {
+    const source = new EventSource(`/api/game/optimal-guess/stream?budget_ms=${OPTIMAL_GUESS_BUDGET_MS}`);
+    let progressMessage = null;
+
+    source.addEventListener('progress', function(e) {
+        const progress = JSON.parse(e.data);
+        const text = `🔍 Searching... ${Math.round(progress.searched * 100)}% (best so far: ${progress.guess})`;
+        if (progressMessage) {
+            progressMessage.textContent = text;
+        } else {
+            progressMessage = showMessage(text, 'info');
+        }
+    });
+
+    source.addEventListener('done', function(e) {
+        source.close();
+        if (progressMessage) {
+            progressMessage.remove();
+        }
+
+        const result = JSON.parse(e.data);
         if (result.success) {
-            showMessage(`💡 Computer's optimal guess: ${result.guess}`, 'info');
+            const note = result.complete ? '' : ' (best found in time)';
+            showMessage(`💡 Computer's optimal guess: ${result.guess}${note}`, 'info');
         } else {
             showMessage(result.message, 'error');
         }
-    } catch (error) {
+    });
+
+    source.onerror = function() {
+        source.close();
+        if (progressMessage) {
+            progressMessage.remove();
+        }
         showMessage('Error getting optimal guess', 'error');
-    }
+    };
 }
 
 async function makeComputerGuess() {
     try {
-        const response = await fetch('/api/game/computer-guess', {
+        const response = await fetch('/api/game/computer-guess?compact=1', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -179,6 +240,7 @@ async function makeComputerGuess() {
 function displayGuessResult(result) {
     const row = document.getElementById(`row-${result.guess_number - 1}`);
     const tiles = row.children;
+    const results = decodePattern(result.pattern);
     
     // Fill in the word
     for (let i = 0; i < 5; i++) {
@@ -194,9 +256,9 @@ function displayGuessResult(result) {
             setTimeout(() => {
                 tiles[i].classList.remove('flip');
                 
-                if (result.results[i] === 'CORRECT') {
+                if (results[i] === 'CORRECT') {
                     tiles[i].classList.add('correct');
-                } else if (result.results[i] === 'WRONG_POSITION') {
+                } else if (results[i] === 'WRONG_POSITION') {
                     tiles[i].classList.add('wrong-position');
                 } else {
                     tiles[i].classList.add('incorrect');
@@ -300,8 +362,7 @@ function showUndoModal() {
 
 async function loadUndoOptions() {
     try {
-        const response = await fetch('/api/game/history');
-        const history = await response.json();
+        const history = (await refreshState()).history;
         
         const undoButtons = document.getElementById('undoButtons');
         undoButtons.innerHTML = '';
@@ -349,8 +410,7 @@ function showHistoryModal() {
 
 async function loadHistory() {
     try {
-        const response = await fetch('/api/game/history');
-        const history = await response.json();
+        const history = (await refreshState()).history;
         
         const historyContent = document.getElementById('historyContent');
         historyContent.innerHTML = '';
@@ -371,7 +431,7 @@ async function loadHistory() {
             const result = document.createElement('div');
             result.className = 'history-result';
             
-            item.letter_results.forEach(letterResult => {
+            decodePattern(item.pattern).forEach(letterResult => {
                 const resultTile = document.createElement('div');
                 resultTile.className = `result-tile ${letterResult.toLowerCase().replace('_', '-')}`;
                 resultTile.textContent = letterResult === 'CORRECT' ? '🟩' : 
@@ -400,8 +460,7 @@ function showPossibleWordsModal() {
 
 async function loadPossibleWordsOptions() {
     try {
-        const response = await fetch('/api/game/history');
-        const history = await response.json();
+        const history = (await refreshState()).history;
         
         const historySelect = document.getElementById('historySelect');
         historySelect.innerHTML = '<option value="0">Current state</option>';
@@ -423,9 +482,10 @@ document.getElementById('historySelect').addEventListener('change', function() {
     loadPossibleWords(parseInt(this.value));
 });
 
-async function loadPossibleWords(guessNumber) {
+async function loadPossibleWords(guessNumber, page = 0) {
     try {
-        const response = await fetch(`/api/game/possible-words/${guessNumber}`);
+        const response = await fetch(
+            `/api/game/possible-words/${guessNumber}?page=${page}&page_size=${POSSIBLE_WORDS_PAGE_SIZE}`);
         const result = await response.json();
         
         const possibleWordsContent = document.getElementById('possibleWordsContent');
@@ -435,8 +495,14 @@ async function loadPossibleWords(guessNumber) {
             return;
         }
         
-        const wordsList = document.createElement('div');
-        wordsList.className = 'words-list';
+        // The first page replaces the list, later pages are appended to it
+        let wordsList = possibleWordsContent.querySelector('.words-list');
+        if (page === 0 || !wordsList) {
+            possibleWordsContent.innerHTML = '';
+            wordsList = document.createElement('div');
+            wordsList.className = 'words-list';
+            possibleWordsContent.appendChild(wordsList);
+        }
         
         result.words.forEach(word => {
             const wordItem = document.createElement('div');
@@ -445,14 +511,22 @@ async function loadPossibleWords(guessNumber) {
             wordsList.appendChild(wordItem);
         });
         
-        possibleWordsContent.innerHTML = '';
-        possibleWordsContent.appendChild(wordsList);
+        possibleWordsContent.querySelectorAll('.words-footer').forEach(element => element.remove());
         
         const countInfo = document.createElement('p');
+        countInfo.className = 'words-footer';
         countInfo.textContent = `${result.count} possible words`;
         countInfo.style.marginTop = '10px';
         countInfo.style.fontWeight = '600';
         possibleWordsContent.appendChild(countInfo);
+        
+        if ((page + 1) * POSSIBLE_WORDS_PAGE_SIZE < result.count) {
+            const loadMore = document.createElement('button');
+            loadMore.className = 'btn btn-secondary words-footer';
+            loadMore.textContent = 'Load more';
+            loadMore.onclick = () => loadPossibleWords(guessNumber, page + 1);
+            possibleWordsContent.appendChild(loadMore);
+        }
     } catch (error) {
         showMessage('Error loading possible words', 'error');
     }
@@ -472,41 +546,35 @@ function updateGameStatus(status) {
     wordInput.disabled = gameOver;
 }
 
-async function updateBoardFromHistory() {
-    try {
-        const response = await fetch('/api/game/history');
-        const history = await response.json();
-        
-        // Clear board
-        for (let i = 0; i < 6; i++) {
-            for (let j = 0; j < 5; j++) {
-                const tile = document.getElementById(`tile-${i}-${j}`);
-                tile.textContent = '';
-                tile.className = 'tile';
-            }
+function updateBoardFromHistory() {
+    // Clear board
+    for (let i = 0; i < 6; i++) {
+        for (let j = 0; j < 5; j++) {
+            const tile = document.getElementById(`tile-${i}-${j}`);
+            tile.textContent = '';
+            tile.className = 'tile';
         }
+    }
+    
+    // Fill in history
+    gameState.history.forEach((item, index) => {
+        const row = document.getElementById(`row-${index}`);
+        const tiles = row.children;
+        const results = decodePattern(item.pattern);
         
-        // Fill in history
-        history.forEach((item, index) => {
-            const row = document.getElementById(`row-${index}`);
-            const tiles = row.children;
+        for (let i = 0; i < 5; i++) {
+            tiles[i].textContent = item.word_guessed[i];
+            tiles[i].classList.add('filled');
             
-            for (let i = 0; i < 5; i++) {
-                tiles[i].textContent = item.word_guessed[i];
-                tiles[i].classList.add('filled');
-                
-                if (item.letter_results[i] === 'CORRECT') {
-                    tiles[i].classList.add('correct');
-                } else if (item.letter_results[i] === 'WRONG_POSITION') {
-                    tiles[i].classList.add('wrong-position');
-                } else {
-                    tiles[i].classList.add('incorrect');
-                }
+            if (results[i] === 'CORRECT') {
+                tiles[i].classList.add('correct');
+            } else if (results[i] === 'WRONG_POSITION') {
+                tiles[i].classList.add('wrong-position');
+            } else {
+                tiles[i].classList.add('incorrect');
             }
-        });
-    } catch (error) {
-        console.error('Error updating board from history:', error);
-    }
+        }
+    });
 }
 
 function resetGame() {
@@ -555,6 +623,8 @@ function showMessage(text, type) {
     setTimeout(() => {
         message.remove();
     }, 5000);
+
+    return message;
 }
 
 function closeModal(modalId) {
@@ -0,0 +1,239 @@
+import hashlib
+import os
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from artifact import letter_presence, load_artifact, unpack_words
+from bitset import lowest_index, mask_to_indices
+from constraints import Constraints
+from decision_tree import DecisionTree, tree_file
+from guess_cache import GuessCache, fingerprint
+from lookahead import LOOKAHEAD_BEAM, LOOKAHEAD_DEPTH, Lookahead, lower_bound
+from parallel import ParallelScorer
+from patterns import load_pattern_matrix
+from scoring import anytime_search, best_guess, best_joint_guess
+from word_index import WordIndex
+
+# Candidate sets smaller than this are scored in-process; the pool round trip costs more
+PARALLEL_MIN_CANDIDATES = 64
+
+
+def load_words(filename: str) -> List[str]:
+    """Load words from a file, filtering for 5-letter words."""
+    try:
+        with open(filename, 'r') as f:
+            words = [word.strip().upper() for word in f.readlines()]
+            return [word for word in words if len(word) == 5 and word.isalpha()]
+    except FileNotFoundError:
+        print(f"Warning: {filename} not found. Using sample words.")
+        # Sample words for demonstration
+        if "potential" in filename:
+            return ["CRANE", "SLATE", "ROATE", "RAISE", "ADIEU", "AUDIO", "HOUSE", "MOUSE", "PHONE", "STONE"]
+        else:
+            return ["CRANE", "SLATE", "ROATE", "RAISE", "ADIEU", "AUDIO", "HOUSE", "MOUSE", "PHONE", "STONE",
+                    "ABOUT", "WORLD", "WOULD", "THERE", "THEIR", "COULD", "OTHER", "AFTER", "FIRST", "NEVER"]
+
+
+class WordData:
+    """Read-only word lists and precomputed tables shared by every game."""
+
+    _cache: Dict[Tuple[str, str], 'WordData'] = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, potential_file: str = "potential.txt", acceptable_file: str = "acceptable.txt"):
+        self.potential_file = potential_file
+        self.acceptable_file = acceptable_file
+
+        # Memory-mapped from the compiled artifact (see artifact.py), rebuilt when the text files change
+        tables = load_artifact(potential_file, acceptable_file)
+        if tables is not None:
+            self.potential_words = unpack_words(tables['potential_words'])
+            self.acceptable_words = unpack_words(tables['acceptable_words'])
+        else:
+            self.potential_words = tuple(load_words(potential_file))
+            self.acceptable_words = tuple(load_words(acceptable_file))
+
+        # Row / column of each word in the pattern matrix
+        self.guess_index = {word: i for i, word in enumerate(self.acceptable_words)}
+        self.answer_index = {word: i for i, word in enumerate(self.potential_words)}
+
+        if tables is not None:
+            self.potential_lookup = WordIndex(self.potential_words, tables['potential_positions'],
+                                              tables['potential_counts'])
+            self.acceptable_lookup = WordIndex(self.acceptable_words, tables['acceptable_positions'],
+                                               tables['acceptable_counts'])
+            self.pattern_matrix = tables['pattern_matrix']
+            self.guess_letters = tables['guess_letters']
+            self.answer_letters = tables['answer_letters']
+            self.answer_rows = tables['answer_rows'].astype(np.intp)
+        else:
+            # Membership sets and letter posting bitsets for validation and filtering
+            self.potential_lookup = WordIndex(self.potential_words)
+            self.acceptable_lookup = WordIndex(self.acceptable_words)
+
+            # Precomputed guess x answer feedback codes, memory-mapped from disk
+            self.pattern_matrix = load_pattern_matrix(potential_file, acceptable_file,
+                                                      list(self.acceptable_words), list(self.potential_words))
+            self.pattern_matrix.setflags(write=False)
+
+            # Which letters each word contains, and each answer's row in the guess list, for search ordering
+            self.guess_letters = letter_presence(self.acceptable_words)
+            self.answer_letters = letter_presence(self.potential_words)
+            self.answer_rows = np.array([self.guess_index.get(word, -1) for word in self.potential_words],
+                                        dtype=np.intp)
+
+        # Optional process pool for the optimal-guess search, see enable_parallel()
+        self.parallel_scorer = None
+
+        # Precomputed strategy from the opening position, built offline by decision_tree.py
+        path = tree_file(potential_file, acceptable_file)
+        self.decision_tree = DecisionTree.load(path) if path else None
+
+        # Memoized optimal guesses per candidate set, shared by every game
+        self.guess_cache = GuessCache()
+
+        # Multi-step search with its own memo of subproblems, see lookahead_guess()
+        self.lookahead = Lookahead(self)
+
+    @classmethod
+    def load(cls, potential_file: str = "potential.txt", acceptable_file: str = "acceptable.txt") -> 'WordData':
+        """Return the shared WordData for these files, loading it on first use."""
+        key = (os.path.abspath(potential_file), os.path.abspath(acceptable_file))
+        with cls._cache_lock:
+            if key not in cls._cache:
+                cls._cache[key] = cls(potential_file, acceptable_file)
+            return cls._cache[key]
+
+    def enable_parallel(self, workers: int = None):
+        """Start a process pool that shards optimal-guess searches across `workers` cores."""
+        if self.parallel_scorer is None:
+            self.parallel_scorer = ParallelScorer(self, workers)
+
+    def best_guess(self, candidates: np.ndarray, guesses: np.ndarray = None) -> Tuple[int, float]:
+        """Return the best guess row (out of `guesses`, default all) and its expected remaining words."""
+        if self.parallel_scorer is not None and len(candidates) >= PARALLEL_MIN_CANDIDATES:
+            return self.parallel_scorer.best_guess(candidates, guesses)
+        return best_guess(self.pattern_matrix, candidates, guesses)
+
+    def optimal_guess(self, candidates: int, constraints: Constraints = None) -> str:
+        """Return the guess minimizing expected remaining words for a candidate bitset."""
+        return self.optimal_guess_and_score(candidates, constraints)[0]
+
+    def optimal_guess_and_score(self, candidates: int, constraints: Constraints = None) -> Tuple[str, float]:
+        """
+        Return the optimal guess and its expected remaining words, memoized by candidate set.
+        Constraints only let the search skip guesses made of resolved letters, which can never
+        win, so they are not part of the cache key.
+        """
+        if candidates.bit_count() <= 2:
+            return self.potential_words[lowest_index(candidates)], 1.0
+
+        key = fingerprint(candidates)
+        cached = self.guess_cache.get(key)
+        if cached is not None:
+            return cached
+
+        guess_index, score = self.best_guess(mask_to_indices(candidates, len(self.potential_words)),
+                                             self.search_guesses(constraints))
+        self.guess_cache.put(key, self.acceptable_words[guess_index], score)
+        return self.acceptable_words[guess_index], score
+
+    def lookahead_guess(self, candidates: int, constraints: Constraints = None,
+                        depth: int = LOOKAHEAD_DEPTH, beam: int = LOOKAHEAD_BEAM) -> Tuple[str, float]:
+        """Return the guess minimizing expected total guesses by multi-step lookahead, and that expectation."""
+        count = candidates.bit_count()
+        if count <= 2:
+            return self.potential_words[lowest_index(candidates)], lower_bound(count)
+        return self.lookahead.best_guess(mask_to_indices(candidates, len(self.potential_words)),
+                                         self.search_guesses(constraints), depth, beam)
+
+    def joint_guess(self, boards: List[int], constraints: List[Constraints] = None) -> Tuple[str, float]:
+        """
+        Return the guess minimizing the expected words left summed over several boards'
+        candidate bitsets, and that expectation. Boards with the same candidates are scored
+        once, so an opening position costs no more than a single board, and results are
+        memoized by the whole set of boards.
+        """
+        weights = {}
+        for candidates in boards:
+            weights[candidates] = weights.get(candidates, 0) + 1
+        keys = sorted((fingerprint(candidates), count) for candidates, count in weights.items())
+        key = hashlib.blake2b(b'joint' + b''.join(fp + count.to_bytes(2, 'little') for fp, count in keys),
+                              digest_size=16).digest()
+        cached = self.guess_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # A guess is worth scoring while it is informative on at least one board
+        guesses = None
+        if constraints is not None:
+            informative = 0
+            for board_constraints in constraints:
+                board_informative = board_constraints.informative_guesses(self.acceptable_lookup)
+                if not board_informative:
+                    informative = 0
+                    break
+                informative |= board_informative
+            if informative:
+                guesses = mask_to_indices(informative, len(self.acceptable_words))
+
+        row, score = best_joint_guess(self.pattern_matrix,
+                                      [mask_to_indices(candidates, len(self.potential_words)) for candidates in weights],
+                                      guesses, np.array(list(weights.values()), dtype=float))
+        self.guess_cache.put(key, self.acceptable_words[row], score)
+        return self.acceptable_words[row], score
+
+    def search_guesses(self, constraints: Constraints = None) -> Optional[np.ndarray]:
+        """Guess rows worth scoring under these constraints, or None for all of them."""
+        if constraints is not None:
+            informative = constraints.informative_guesses(self.acceptable_lookup)
+            if informative:
+                return mask_to_indices(informative, len(self.acceptable_words))
+        return None
+
+    def search_order(self, candidates: np.ndarray, guesses: np.ndarray = None) -> np.ndarray:
+        """
+        Order guess rows so the most promising are scored first: the candidates themselves,
+        then by how evenly their letters split the candidates (c * (n - c) per distinct letter).
+        """
+        if guesses is None:
+            guesses = np.arange(len(self.acceptable_words))
+        letter_counts = self.answer_letters[candidates].sum(axis=0, dtype=np.int64)
+        weights = self.guess_letters[guesses].astype(np.int64) @ (letter_counts * (len(candidates) - letter_counts))
+        is_candidate = np.isin(guesses, self.answer_rows[candidates])
+        return guesses[np.lexsort((guesses, -weights, ~is_candidate))]
+
+    def optimal_guess_progress(self, candidates: int, constraints: Constraints = None) -> Iterator[Dict]:
+        """
+        Anytime optimal-guess search: yields the best guess so far after each scored block.
+        Stop iterating at any point for a best-effort answer; a search run to completion
+        returns exactly what optimal_guess() would, and is cached.
+        """
+        if candidates.bit_count() <= 2:
+            yield {'guess': self.potential_words[lowest_index(candidates)], 'expected_remaining': 1.0,
+                   'searched': 1.0, 'complete': True}
+            return
+
+        key = fingerprint(candidates)
+        cached = self.guess_cache.get(key)
+        if cached is not None:
+            yield {'guess': cached[0], 'expected_remaining': cached[1], 'searched': 1.0, 'complete': True}
+            return
+
+        indices = mask_to_indices(candidates, len(self.potential_words))
+        order = self.search_order(indices, self.search_guesses(constraints))
+        for best_row, best_sum, scored, remaining in anytime_search(self.pattern_matrix, indices, order):
+            guess, score = self.acceptable_words[best_row], best_sum / len(indices)
+            if not remaining:
+                self.guess_cache.put(key, guess, score)
+            yield {'guess': guess, 'expected_remaining': score,
+                   'searched': scored / (scored + remaining), 'complete': not remaining}
+
+    def tree_guess(self, path: List[Tuple[int, int]]) -> Optional[str]:
+        """Look up the next guess after (guess row, pattern code) pairs in the decision tree."""
+        if self.decision_tree is None:
+            return None
+        row = self.decision_tree.guess_for(path)
+        return self.acceptable_words[row] if row is not None else None
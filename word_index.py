@@ -0,0 +1,68 @@
+from collections import Counter
+from typing import Sequence
+
+import numpy as np
+
+from bitset import full_mask
+from patterns import CORRECT, WRONG_POSITION
+
+
+def mask_from_packed(packed: np.ndarray) -> int:
+    """Build a bitset from little-endian packed bits."""
+    return int.from_bytes(packed.tobytes(), 'little')
+
+
+class WordIndex:
+    """
+    Inverted index over one word list.
+    Holds a hashed membership set plus posting bitsets per (position, letter) and
+    per (letter, minimum count), so feedback turns into a handful of bitset
+    intersections instead of a per-word pattern check.
+    """
+
+    def __init__(self, words: Sequence[str], positions: np.ndarray = None, counts: np.ndarray = None):
+        """Index the words, from precompiled posting tables (see artifact.posting_tables) when given."""
+        self.words = words
+        self.members = frozenset(words)
+        self.all_words = full_mask(len(words))
+
+        if positions is None or counts is None:
+            from artifact import posting_tables
+            tables = posting_tables(words)
+            positions, counts = tables['positions'], tables['counts']
+        # position_masks[i][letter]: words with `letter` at position i
+        self.position_masks = [[mask_from_packed(positions[i, letter]) for letter in range(26)] for i in range(5)]
+        # count_masks[letter][n]: words containing `letter` at least n times
+        self.count_masks = [[mask_from_packed(counts[letter, n]) for n in range(7)] for letter in range(26)]
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.members
+
+    def feedback_mask(self, guess: str, pattern: int) -> int:
+        """Return the bitset of words that would give exactly this pattern code for the guess."""
+        mask = self.all_words
+        required = Counter()
+        excluded = set()
+
+        for i, letter in enumerate(guess):
+            letter = ord(letter) - ord('A')
+            result = pattern % 3
+            pattern //= 3
+            if result == CORRECT:
+                mask &= self.position_masks[i][letter]
+                required[letter] += 1
+            else:
+                # A yellow or grey letter can never sit at this position
+                mask &= ~self.position_masks[i][letter]
+                if result == WRONG_POSITION:
+                    required[letter] += 1
+                else:
+                    excluded.add(letter)
+
+        # Greens and yellows set a minimum count; any grey copy caps it at exactly that
+        for letter, count in required.items():
+            mask &= self.count_masks[letter][count]
+        for letter in excluded:
+            mask &= ~self.count_masks[letter][required[letter] + 1]
+
+        return mask